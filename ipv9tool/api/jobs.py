@@ -60,10 +60,12 @@ class JobManager:
             job_id: Job ID
 
         Returns:
-            Job data or None if not found
+            Snapshot of the job data, or None if not found
         """
         with self.lock:
-            return self.jobs.get(job_id)
+            job = self.jobs.get(job_id)
+            # Copy under the lock; worker threads keep updating the original
+            return dict(job) if job is not None else None
 
     def update_job(self, job_id: str, **kwargs):
         """
@@ -90,7 +92,7 @@ class JobManager:
             List of jobs
         """
         with self.lock:
-            jobs = list(self.jobs.values())
+            jobs = [dict(job) for job in self.jobs.values()]
 
             if status:
                 jobs = [j for j in jobs if j['status'] == status]
@@ -52,11 +52,11 @@ async def lifespan(app: FastAPI):
 
     setup_logging(config.get('logging', {}))
 
-    app_state['resolver'] = IPv9Resolver(config)
     app_state['cache'] = DNSCache(
         max_size=config['dns']['cache_size'],
         default_ttl=config['dns']['ttl']
     )
+    app_state['resolver'] = IPv9Resolver(config, cache=app_state['cache'])
     app_state['scanner'] = PortScanner(config)
     app_state['discovery'] = HostDiscovery(config)
     app_state['enumerator'] = DNSEnumerator(app_state['resolver'], config)
@@ -115,7 +115,7 @@ def create_api_app(config_path: Optional[str] = None) -> FastAPI:
             app_state['config']['dns']['primary'],
             app_state['config']['dns']['secondary']
         )
-        dns_status = forwarder.check_dns_reachability()
+        dns_status = await asyncio.to_thread(forwarder.check_dns_reachability)
         dns_reachable = all(s['reachable'] for s in dns_status.values())
 
         # Check database
@@ -171,7 +171,9 @@ def create_api_app(config_path: Optional[str] = None) -> FastAPI:
                     )
 
             # Resolve
-            addresses = resolver.resolve(request.hostname, request.record_type)
+            addresses = await asyncio.to_thread(
+                resolver.resolve, request.hostname, request.record_type
+            )
 
             if addresses and request.use_cache:
                 cache.set(request.hostname, addresses, request.record_type)
@@ -199,13 +201,13 @@ def create_api_app(config_path: Optional[str] = None) -> FastAPI:
 
             # Resolve if IPv9 domain
             if resolver.is_ipv9_domain(target):
-                addresses = resolver.resolve(target)
+                addresses = await asyncio.to_thread(resolver.resolve, target)
                 if not addresses:
                     raise HTTPException(status_code=404, detail="Failed to resolve hostname")
                 target = addresses[0]
 
             # Ping
-            result = discovery.ping(target, request.count)
+            result = await asyncio.to_thread(discovery.ping, target, request.count)
 
             stats = result.get('statistics', {})
 
@@ -238,14 +240,15 @@ def create_api_app(config_path: Optional[str] = None) -> FastAPI:
 
             # Resolve if IPv9 domain
             if resolver.is_ipv9_domain(target):
-                addresses = resolver.resolve(target)
+                addresses = await asyncio.to_thread(resolver.resolve, target)
                 if not addresses:
                     raise HTTPException(status_code=404, detail="Failed to resolve hostname")
                 target = addresses[0]
 
-            # Scan
+            # Scan (nmap runs as an asyncio subprocess, killed if the
+            # request is cancelled)
             start_time = time.time()
-            result = scanner.scan_nmap(
+            result = await scanner.scan_nmap_async(
                 target,
                 ports=request.ports,
                 scan_type=request.scan_type,
@@ -306,7 +309,8 @@ def create_api_app(config_path: Optional[str] = None) -> FastAPI:
             enumerator = app_state['enumerator']
 
             start_time = time.time()
-            results = enumerator.brute_force_pattern(
+            results = await asyncio.to_thread(
+                enumerator.brute_force_pattern,
                 request.pattern,
                 request.tld,
                 request.max_combinations
@@ -463,7 +467,9 @@ async def run_full_enumeration(job_id: str):
         total = len(patterns)
 
         for i, pattern in enumerate(patterns):
-            results = enumerator.brute_force_pattern(pattern, "chn", 10000)
+            results = await asyncio.to_thread(
+                enumerator.brute_force_pattern, pattern, "chn", 10000
+            )
             all_results.extend(results)
 
             progress = (i + 1) / total * 100
@@ -13,7 +13,13 @@ logger = logging.getLogger(__name__)
 
 
 class AuditEngine:
-    """Comprehensive IPv9 network audit engine"""
+    """
+    Comprehensive IPv9 network audit engine
+
+    The resolver, scanner and discovery components are synchronous; every
+    call into them is run via asyncio.to_thread so an audit never blocks
+    the event loop it is awaited from (e.g. the TUI).
+    """
 
     def __init__(self, resolver, scanner, discovery, enumerator, db_manager):
         """
@@ -151,7 +157,7 @@ class AuditEngine:
         )
 
         # Check DNS server reachability
-        dns_status = forwarder.check_dns_reachability()
+        dns_status = await asyncio.to_thread(forwarder.check_dns_reachability)
 
         for server, status in dns_status.items():
             if status['reachable']:
@@ -175,7 +181,7 @@ class AuditEngine:
         test_domains = ['www.v9.chn', 'em777.chn', 'www.hqq.chn']
 
         for domain in test_domains:
-            addresses = self.resolver.resolve(domain)
+            addresses = await asyncio.to_thread(self.resolver.resolve, domain)
             if addresses:
                 self.findings.append({
                     'type': 'dns_resolution',
@@ -206,7 +212,9 @@ class AuditEngine:
         # Sample each prefix
         for prefix in mobile_prefixes[:10]:  # Limit for performance
             pattern = f"86{prefix}NNNNNNNN"
-            results = self.enumerator.brute_force_pattern(pattern, "chn", 100)
+            results = await asyncio.to_thread(
+                self.enumerator.brute_force_pattern, pattern, "chn", 100
+            )
 
             for result in results:
                 await self.db.store_domain({
@@ -235,7 +243,7 @@ class AuditEngine:
             ip = host['ip_address']
 
             # Ping test
-            ping_result = self.discovery.ping(ip, count=2)
+            ping_result = await asyncio.to_thread(self.discovery.ping, ip, count=2)
 
             if ping_result.get('reachable'):
                 discovered.append(ip)
@@ -256,36 +264,40 @@ class AuditEngine:
 
         common_ports = "21,22,23,25,53,80,110,135,139,143,443,445,993,995,1433,1521,3306,3389,5432,5900,8000,8080,8443,8888"
 
-        for host in hosts[:100]:  # Limit for performance
-            try:
-                result = self.scanner.scan_nmap(
-                    host,
-                    ports=common_ports,
-                    scan_type="syn",
-                    service_detection=True
-                )
-
-                if 'hosts' in result:
-                    for host_data in result['hosts']:
-                        for port in host_data.get('ports', []):
-                            if port['state'] == 'open':
-                                self.findings.append({
-                                    'type': 'open_port',
-                                    'severity': 'info',
-                                    'host': host,
-                                    'port': port['port'],
-                                    'service': port.get('service', {}).get('name'),
-                                    'version': port.get('service', {}).get('version')
-                                })
-            except Exception as e:
-                logger.error(f"Scan failed for {host}: {e}")
+        targets = hosts[:100]  # Limit for performance
+
+        # One nmap process per host, several running at once
+        results = await self.scanner.scan_nmap_many_async(
+            targets,
+            ports=common_ports,
+            scan_type="syn",
+            service_detection=True
+        )
+
+        for host, result in zip(targets, results):
+            if 'error' in result:
+                logger.error(f"Scan failed for {host}: {result['error']}")
+                continue
+
+            for host_data in result.get('hosts', []):
+                for port in host_data.get('ports', []):
+                    if port['state'] == 'open':
+                        self.findings.append({
+                            'type': 'open_port',
+                            'severity': 'info',
+                            'host': host,
+                            'port': port['port'],
+                            'service': port.get('service', {}).get('name'),
+                            'version': port.get('service', {}).get('version')
+                        })
 
     async def _scan_all_ports(self, hosts: List[str]):
         """Scan all ports on hosts using masscan"""
         logger.info(f"Scanning all ports on {len(hosts)} hosts (masscan)...")
 
         # Use masscan for high-speed full port scan
-        result = self.scanner.scan_masscan(
+        result = await asyncio.to_thread(
+            self.scanner.scan_masscan,
             hosts[:100],  # Limit for performance
             ports="1-65535"
         )
@@ -307,7 +319,9 @@ class AuditEngine:
         # HTTP service inspection
         for host in hosts[:50]:  # Limit for performance
             # Try HTTP
-            http_result = self.discovery.http_probe(host, port=80, use_https=False)
+            http_result = await asyncio.to_thread(
+                self.discovery.http_probe, host, port=80, use_https=False
+            )
             if http_result.get('reachable'):
                 self.findings.append({
                     'type': 'http_service',
@@ -319,7 +333,9 @@ class AuditEngine:
                 })
 
             # Try HTTPS
-            https_result = self.discovery.http_probe(host, port=443, use_https=True)
+            https_result = await asyncio.to_thread(
+                self.discovery.http_probe, host, port=443, use_https=True
+            )
             if https_result.get('reachable'):
                 self.findings.append({
                     'type': 'https_service',
@@ -4,16 +4,62 @@ Masscan-based Full Network Enumerator
 Uses masscan for high-speed enumeration of the entire IPv9 address space.
 """
 
+import asyncio
 import subprocess
 import json
 import logging
 import tempfile
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, AsyncIterator
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+# Known Chinese IP blocks (sample - would need comprehensive list)
+IPV9_IP_RANGES = [
+    '1.0.0.0/8',      # APNIC/China
+    '14.0.0.0/8',     # China Telecom
+    '27.0.0.0/8',     # APNIC/China
+    '36.0.0.0/8',     # China Telecom
+    '42.0.0.0/8',     # APNIC/China
+    '58.0.0.0/8',     # China Unicom
+    '59.0.0.0/8',     # China Telecom
+    '60.0.0.0/8',     # China Telecom
+    '61.0.0.0/8',     # APNIC/China
+    '101.0.0.0/8',    # China Mobile
+    '106.0.0.0/8',    # China Unicom
+    '110.0.0.0/8',    # China Telecom
+    '111.0.0.0/8',    # China Mobile
+    '112.0.0.0/8',    # China Telecom
+    '113.0.0.0/8',    # China Mobile
+    '114.0.0.0/8',    # China Telecom
+    '115.0.0.0/8',    # China Telecom
+    '116.0.0.0/8',    # China Unicom
+    '117.0.0.0/8',    # China Mobile
+    '118.0.0.0/8',    # China Telecom
+    '119.0.0.0/8',    # China Telecom
+    '120.0.0.0/8',    # China Mobile
+    '121.0.0.0/8',    # China Telecom
+    '122.0.0.0/8',    # China Telecom
+    '123.0.0.0/8',    # China Telecom
+    '124.0.0.0/8',    # China Telecom
+    '125.0.0.0/8',    # China Telecom
+    '180.0.0.0/8',    # China Telecom
+    '182.0.0.0/8',    # China Unicom
+    '183.0.0.0/8',    # China Telecom
+    '202.0.0.0/8',    # APNIC/China
+    '203.0.0.0/8',    # APNIC/China
+    '210.0.0.0/8',    # APNIC/China
+    '211.0.0.0/8',    # APNIC/China
+    '218.0.0.0/8',    # China Unicom
+    '219.0.0.0/8',    # China Telecom
+    '220.0.0.0/8',    # China Telecom
+    '221.0.0.0/8',    # China Unicom
+    '222.0.0.0/8',    # China Telecom
+    '223.0.0.0/8',    # China Mobile
+]
+
+
 class MasscanEnumerator:
     """High-speed masscan-based network enumerator"""
 
@@ -125,34 +171,15 @@ class MasscanEnumerator:
         try:
             with open(output_file, 'r') as f:
                 for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
+                    entry = self._parse_masscan_line(line)
+                    if entry is None:
                         continue
 
-                    try:
-                        entry = json.loads(line.rstrip(','))
-
-                        if 'ip' in entry and 'ports' in entry:
-                            ip = entry['ip']
-
-                            if ip not in hosts:
-                                hosts[ip] = {
-                                    'ip': ip,
-                                    'ports': [],
-                                    'timestamp': entry.get('timestamp')
-                                }
-
-                            for port_data in entry['ports']:
-                                hosts[ip]['ports'].append({
-                                    'port': port_data.get('port'),
-                                    'proto': port_data.get('proto'),
-                                    'status': port_data.get('status'),
-                                    'reason': port_data.get('reason'),
-                                    'ttl': port_data.get('ttl')
-                                })
-
-                    except json.JSONDecodeError:
-                        continue
+                    ip = entry['ip']
+                    if ip not in hosts:
+                        hosts[ip] = entry
+                    else:
+                        hosts[ip]['ports'].extend(entry['ports'])
 
             return {
                 'hosts': list(hosts.values()),
@@ -164,6 +191,117 @@ class MasscanEnumerator:
             logger.error(f"Failed to parse masscan output: {e}")
             return {'hosts': [], 'total_hosts': 0, 'total_ports': 0}
 
+    def _parse_masscan_line(self, line) -> Optional[Dict[str, Any]]:
+        """
+        Parse one masscan JSON output line
+
+        Args:
+            line: Output line (str or bytes)
+
+        Returns:
+            {'ip', 'ports', 'timestamp'} entry, or None for framing,
+            comments and malformed lines
+        """
+        line = line.strip()
+        if not line or line[:1] in ('#', '[', ']', b'#', b'[', b']'):
+            return None
+
+        try:
+            entry = json.loads(line.rstrip(b',' if isinstance(line, bytes) else ','))
+        except json.JSONDecodeError:
+            return None
+
+        if 'ip' not in entry or 'ports' not in entry:
+            return None
+
+        return {
+            'ip': entry['ip'],
+            'ports': [
+                {
+                    'port': port_data.get('port'),
+                    'proto': port_data.get('proto'),
+                    'status': port_data.get('status'),
+                    'reason': port_data.get('reason'),
+                    'ttl': port_data.get('ttl')
+                }
+                for port_data in entry['ports']
+            ],
+            'timestamp': entry.get('timestamp')
+        }
+
+    async def enumerate_full_network_async(
+        self,
+        ip_ranges: List[str],
+        ports: str = "80,443,8080,22,21",
+        exclude: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Enumerate network using masscan, yielding results as they arrive
+
+        masscan writes JSON to stdout and each record is yielded as soon as
+        it is read, so callers stay responsive for the whole scan.
+        Cancelling the consuming task (or closing the iterator) kills
+        masscan.
+
+        Args:
+            ip_ranges: List of IP ranges to scan (CIDR notation)
+            ports: Ports to scan
+            exclude: IP ranges to exclude
+
+        Yields:
+            {'ip', 'ports', 'timestamp'} entries, one per masscan record
+        """
+        logger.info("Starting streaming masscan enumeration of %d ranges", len(ip_ranges))
+
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as targets_file:
+            for ip_range in ip_ranges:
+                targets_file.write(f"{ip_range}\n")
+            targets_path = targets_file.name
+
+        exclude_path = None
+        cmd = [
+            'masscan',
+            '-iL', targets_path,
+            '-p', ports,
+            '--rate', str(self.rate),
+            '-oJ', '-'  # JSON output to stdout
+        ]
+
+        if exclude:
+            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as exclude_file:
+                for exc in exclude:
+                    exclude_file.write(f"{exc}\n")
+                exclude_path = exclude_file.name
+            cmd.extend(['--excludefile', exclude_path])
+
+        proc = None
+        try:
+            # masscan's stderr is a continuous status line; discard it so
+            # the pipe never fills and stalls the scan
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+
+            async for line in proc.stdout:
+                entry = self._parse_masscan_line(line)
+                if entry is not None:
+                    yield entry
+
+            await proc.wait()
+            if proc.returncode != 0:
+                logger.error("masscan exited with status %d", proc.returncode)
+
+        finally:
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+
+            Path(targets_path).unlink(missing_ok=True)
+            if exclude_path:
+                Path(exclude_path).unlink(missing_ok=True)
+
     def enumerate_ipv9_space(
         self,
         sample_rate: float = 0.01,
@@ -186,56 +324,7 @@ class MasscanEnumerator:
         """
         logger.info(f"Enumerating IPv9 address space (sample rate: {sample_rate})")
 
-        # Known Chinese IP blocks (sample - would need comprehensive list)
-        chinese_ip_ranges = [
-            '1.0.0.0/8',      # APNIC/China
-            '14.0.0.0/8',     # China Telecom
-            '27.0.0.0/8',     # APNIC/China
-            '36.0.0.0/8',     # China Telecom
-            '42.0.0.0/8',     # APNIC/China
-            '58.0.0.0/8',     # China Unicom
-            '59.0.0.0/8',     # China Telecom
-            '60.0.0.0/8',     # China Telecom
-            '61.0.0.0/8',     # APNIC/China
-            '101.0.0.0/8',    # China Mobile
-            '106.0.0.0/8',    # China Unicom
-            '110.0.0.0/8',    # China Telecom
-            '111.0.0.0/8',    # China Mobile
-            '112.0.0.0/8',    # China Telecom
-            '113.0.0.0/8',    # China Mobile
-            '114.0.0.0/8',    # China Telecom
-            '115.0.0.0/8',    # China Telecom
-            '116.0.0.0/8',    # China Unicom
-            '117.0.0.0/8',    # China Mobile
-            '118.0.0.0/8',    # China Telecom
-            '119.0.0.0/8',    # China Telecom
-            '120.0.0.0/8',    # China Mobile
-            '121.0.0.0/8',    # China Telecom
-            '122.0.0.0/8',    # China Telecom
-            '123.0.0.0/8',    # China Telecom
-            '124.0.0.0/8',    # China Telecom
-            '125.0.0.0/8',    # China Telecom
-            '180.0.0.0/8',    # China Telecom
-            '182.0.0.0/8',    # China Unicom
-            '183.0.0.0/8',    # China Telecom
-            '202.0.0.0/8',    # APNIC/China
-            '203.0.0.0/8',    # APNIC/China
-            '210.0.0.0/8',    # APNIC/China
-            '211.0.0.0/8',    # APNIC/China
-            '218.0.0.0/8',    # China Unicom
-            '219.0.0.0/8',    # China Telecom
-            '220.0.0.0/8',    # China Telecom
-            '221.0.0.0/8',    # China Unicom
-            '222.0.0.0/8',    # China Telecom
-            '223.0.0.0/8',    # China Mobile
-        ]
-
-        # Sample ranges based on sample_rate
-        import random
-        sampled_ranges = random.sample(
-            chinese_ip_ranges,
-            int(len(chinese_ip_ranges) * sample_rate)
-        )
+        sampled_ranges = self._sample_ipv9_ranges(sample_rate)
 
         # Run enumeration
         return self.enumerate_full_network(
@@ -244,6 +333,37 @@ class MasscanEnumerator:
             progress_callback=progress_callback
         )
 
+    async def enumerate_ipv9_space_async(
+        self,
+        sample_rate: float = 0.01,
+        ports: str = "80,443"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of enumerate_ipv9_space
+
+        Args:
+            sample_rate: Percentage of address space to sample (0.0-1.0)
+            ports: Ports to scan
+
+        Yields:
+            {'ip', 'ports', 'timestamp'} entries as masscan finds them
+        """
+        logger.info("Enumerating IPv9 address space (sample rate: %s)", sample_rate)
+
+        async for entry in self.enumerate_full_network_async(
+            self._sample_ipv9_ranges(sample_rate),
+            ports=ports
+        ):
+            yield entry
+
+    def _sample_ipv9_ranges(self, sample_rate: float) -> List[str]:
+        """Sample known IPv9 ranges based on sample_rate"""
+        import random
+        return random.sample(
+            IPV9_IP_RANGES,
+            int(len(IPV9_IP_RANGES) * sample_rate)
+        )
+
     def create_enumeration_plan(
         self,
         total_budget_hours: int = 24,
@@ -35,11 +35,11 @@ class IPv9CLI:
         setup_logging(self.config.get('logging', {}))
 
         # Initialize components
-        self.resolver = IPv9Resolver(self.config)
         self.cache = DNSCache(
             max_size=self.config['dns']['cache_size'],
             default_ttl=self.config['dns']['ttl']
         )
+        self.resolver = IPv9Resolver(self.config, cache=self.cache)
         self.scanner = PortScanner(self.config)
         self.discovery = HostDiscovery(self.config)
         self.enumerator = DNSEnumerator(self.resolver, self.config)
@@ -265,6 +265,10 @@ class IPv9CLI:
             print(f"  Valid entries: {stats['valid_entries']}")
             print(f"  Expired entries: {stats['expired_entries']}")
             print(f"  Max size: {stats['max_size']}")
+            lookups = stats['hits'] + stats['misses']
+            hit_rate = stats['hits'] / lookups * 100 if lookups else 0.0
+            print(f"  Hits/misses: {stats['hits']}/{stats['misses']} ({hit_rate:.1f}% hit rate)")
+            print(f"  Evictions: {stats['evictions']} (LRU), {stats['expirations']} (TTL)")
             print(f"  Usage: {stats['total_entries']}/{stats['max_size']} "
                   f"({stats['total_entries']/stats['max_size']*100:.1f}%)")
 
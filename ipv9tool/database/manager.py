@@ -6,9 +6,10 @@ Manages SQLite database for storing discoveries and scan results.
 
 import os
 import sqlite3
+import time
 import aiosqlite
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -18,6 +19,9 @@ logger = logging.getLogger(__name__)
 class DatabaseManager:
     """Manages IPv9 database"""
 
+    # Seconds get_stats may serve a cached result before re-querying
+    STATS_TTL = 2.0
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize database manager
@@ -29,6 +33,10 @@ class DatabaseManager:
         self.db_path = config.get('path', os.path.expanduser('~/.ipv9tool/ipv9.db'))
         self.connection = None
 
+        # get_stats cache; store_* methods reset _stats_at to force a requery
+        self._stats_cached: Optional[Dict[str, Any]] = None
+        self._stats_at = 0.0
+
         # Ensure database directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
@@ -187,6 +195,7 @@ class DatabaseManager:
             await self.store_port(host_id, port_info)
 
         await self.connection.commit()
+        self._stats_at = 0.0
         return host_id
 
     async def store_port(self, host_id: int, port_info) -> int:
@@ -231,6 +240,7 @@ class DatabaseManager:
             port_id = cursor.lastrowid
 
         await self.connection.commit()
+        self._stats_at = 0.0
         return port_id
 
     async def store_domain(self, domain_info) -> int:
@@ -275,8 +285,95 @@ class DatabaseManager:
             domain_id = cursor.lastrowid
 
         await self.connection.commit()
+        self._stats_at = 0.0
         return domain_id
 
+    async def store_ports_bulk(self, rows: List[Tuple]) -> int:
+        """
+        Store or update many ports in a single transaction
+
+        Hosts are looked up (or created) once per address and all ports are
+        upserted with one executemany, so a wide scan costs one commit
+        instead of one per port.
+
+        Args:
+            rows: (ip_address, port, protocol, state, service, version) tuples
+
+        Returns:
+            Number of port rows written
+        """
+        if not rows:
+            return 0
+
+        now = datetime.utcnow()
+
+        host_ids = {}
+        for ip_address in {row[0] for row in rows}:
+            cursor = await self.connection.execute(
+                "SELECT id FROM hosts WHERE ip_address = ?",
+                (ip_address,)
+            )
+            row = await cursor.fetchone()
+
+            if row:
+                host_ids[ip_address] = row[0]
+            else:
+                cursor = await self.connection.execute("""
+                    INSERT INTO hosts (ip_address, first_seen, last_seen)
+                    VALUES (?, ?, ?)
+                """, (ip_address, now, now))
+                host_ids[ip_address] = cursor.lastrowid
+
+        await self.connection.executemany("""
+            INSERT INTO ports (host_id, port, protocol, state, service, version, first_seen, last_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(host_id, port, protocol) DO UPDATE SET
+                state = excluded.state,
+                service = COALESCE(excluded.service, service),
+                version = COALESCE(excluded.version, version),
+                last_seen = excluded.last_seen
+        """, [
+            (host_ids[ip_address], port, protocol, state, service, version, now, now)
+            for ip_address, port, protocol, state, service, version in rows
+        ])
+
+        await self.connection.commit()
+        self._stats_at = 0.0
+        return len(rows)
+
+    async def store_domains_bulk(self, rows: List[Tuple]) -> int:
+        """
+        Store or update many domains in a single transaction
+
+        Args:
+            rows: (hostname, addresses, responsive) tuples
+
+        Returns:
+            Number of domain rows written
+        """
+        import json
+
+        if not rows:
+            return 0
+
+        now = datetime.utcnow()
+
+        await self.connection.executemany("""
+            INSERT INTO domains (hostname, ip_addresses, first_seen, last_seen, responsive)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(hostname) DO UPDATE SET
+                ip_addresses = excluded.ip_addresses,
+                last_seen = excluded.last_seen,
+                responsive = excluded.responsive
+        """, [
+            (hostname, json.dumps(addresses), now, now, responsive)
+            for hostname, addresses, responsive in rows
+        ])
+
+        await self.connection.commit()
+        self._stats_at = 0.0
+        return len(rows)
+
     # Query operations
 
     async def get_hosts(self, alive_only: bool = True, limit: int = 100) -> List[Dict]:
@@ -310,6 +407,12 @@ class DatabaseManager:
 
         return hosts
 
+    async def get_host_ip_map(self) -> Dict[int, str]:
+        """Get a host id -> IP address map (without loading full host rows)"""
+        cursor = await self.connection.execute("SELECT id, ip_address FROM hosts")
+        rows = await cursor.fetchall()
+        return dict(rows)
+
     async def get_ports(
         self,
         host_id: Optional[int] = None,
@@ -352,32 +455,35 @@ class DatabaseManager:
         return ports
 
     async def get_stats(self) -> Dict[str, Any]:
-        """Get network statistics"""
-        stats = {}
-
-        # Total domains
-        cursor = await self.connection.execute("SELECT COUNT(*) FROM domains")
-        stats['total_domains'] = (await cursor.fetchone())[0]
-
-        # Total IPs
-        cursor = await self.connection.execute("SELECT COUNT(*) FROM hosts")
-        stats['total_ips'] = (await cursor.fetchone())[0]
-
-        # Total ports
-        cursor = await self.connection.execute("SELECT COUNT(*) FROM ports")
-        stats['total_ports'] = (await cursor.fetchone())[0]
-
-        # Active hosts
-        cursor = await self.connection.execute("SELECT COUNT(*) FROM hosts WHERE alive = 1")
-        stats['active_hosts'] = (await cursor.fetchone())[0]
-
-        # Responsive web
-        cursor = await self.connection.execute("SELECT COUNT(*) FROM domains WHERE responsive = 1")
-        stats['responsive_web'] = (await cursor.fetchone())[0]
+        """
+        Get network statistics
 
-        # Last scan
-        cursor = await self.connection.execute("SELECT MAX(completed_at) FROM scans WHERE status = 'completed'")
-        last_scan = (await cursor.fetchone())[0]
-        stats['last_scan'] = last_scan
+        Results are cached for STATS_TTL seconds; any store_* call
+        invalidates the cache so fresh writes are reflected immediately.
+        """
+        if self._stats_cached is not None and time.monotonic() - self._stats_at < self.STATS_TTL:
+            return dict(self._stats_cached)
+
+        # One round-trip to the aiosqlite worker thread instead of one
+        # execute/fetch pair per counter
+        cursor = await self.connection.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM domains),
+                (SELECT COUNT(*) FROM hosts),
+                (SELECT COUNT(*) FROM ports),
+                (SELECT COUNT(*) FROM hosts WHERE alive = 1),
+                (SELECT COUNT(*) FROM domains WHERE responsive = 1),
+                (SELECT MAX(completed_at) FROM scans WHERE status = 'completed')
+        """)
+        row = await cursor.fetchone()
 
-        return stats
+        self._stats_cached = {
+            'total_domains': row[0],
+            'total_ips': row[1],
+            'total_ports': row[2],
+            'active_hosts': row[3],
+            'responsive_web': row[4],
+            'last_scan': row[5]
+        }
+        self._stats_at = time.monotonic()
+        return dict(self._stats_cached)
@@ -5,6 +5,8 @@ Caches DNS query results to reduce load on IPv9 DNS servers.
 """
 
 import time
+import heapq
+import threading
 import logging
 from typing import Dict, Optional, List, Tuple
 from collections import OrderedDict
@@ -13,7 +15,16 @@ logger = logging.getLogger(__name__)
 
 
 class DNSCache:
-    """LRU cache for DNS query results"""
+    """
+    LRU cache for DNS query results
+
+    Entries are bounded by max_size (least recently used evicted first) and
+    expire after their TTL. A min-heap of (expiry, key) lets each get/set
+    purge only the entries that have actually expired instead of sweeping
+    the whole cache.
+
+    Safe to share between threads: every public method holds one lock.
+    """
 
     def __init__(self, max_size: int = 1000, default_ttl: int = 300):
         """
@@ -25,13 +36,38 @@ class DNSCache:
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self.cache: OrderedDict[str, Tuple[List[str], float, int]] = OrderedDict()
+        # key -> (addresses, monotonic expiry time)
+        self.cache: OrderedDict[str, Tuple[List[str], float]] = OrderedDict()
+        # (expiry, key); may hold stale pairs for overwritten/evicted keys
+        self._heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+        # Counters reported by stats(); updated under the lock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
         logger.info(f"DNS Cache initialized (max_size={max_size}, default_ttl={default_ttl}s)")
 
     def _make_key(self, hostname: str, record_type: str) -> str:
         """Generate cache key from hostname and record type"""
         return f"{hostname.lower()}:{record_type.upper()}"
 
+    def _purge_expired(self, now: float):
+        """Drop entries whose expiry has passed, oldest expiry first (caller holds the lock)"""
+        heap = self._heap
+        cache = self.cache
+
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            entry = cache.get(key)
+
+            # Skip stale heap pairs left by re-set or evicted keys
+            if entry is not None and entry[1] == expiry:
+                del cache[key]
+                self.expirations += 1
+                logger.debug(f"Cache expired: {key}")
+
     def get(self, hostname: str, record_type: str = 'A') -> Optional[List[str]]:
         """
         Get cached DNS result
@@ -45,20 +81,31 @@ class DNSCache:
         """
         key = self._make_key(hostname, record_type)
 
-        if key not in self.cache:
-            logger.debug(f"Cache miss: {key}")
-            return None
+        with self._lock:
+            now = time.monotonic()
+            self._purge_expired(now)
 
-        addresses, timestamp, ttl = self.cache[key]
+            entry = self.cache.get(key)
+            if entry is None:
+                self.misses += 1
+                logger.debug(f"Cache miss: {key}")
+                return None
 
-        # Check if entry has expired
-        if time.time() - timestamp > ttl:
-            logger.debug(f"Cache expired: {key}")
-            del self.cache[key]
-            return None
+            # Backstop in case the entry's heap pair went missing
+            if entry[1] <= now:
+                del self.cache[key]
+                self.expirations += 1
+                self.misses += 1
+                logger.debug(f"Cache expired: {key}")
+                return None
+
+            self.hits += 1
+
+            addresses = entry[0]
+
+            # Move to end (most recently used)
+            self.cache.move_to_end(key)
 
-        # Move to end (most recently used)
-        self.cache.move_to_end(key)
         logger.debug(f"Cache hit: {key} -> {addresses}")
         return addresses
 
@@ -77,29 +124,44 @@ class DNSCache:
         # Use provided TTL or default
         cache_ttl = ttl if ttl is not None else self.default_ttl
 
-        # Add to cache
-        self.cache[key] = (addresses, time.time(), cache_ttl)
-        self.cache.move_to_end(key)
+        with self._lock:
+            now = time.monotonic()
+            self._purge_expired(now)
+
+            # Add to cache
+            expiry = now + cache_ttl
+            self.cache[key] = (addresses, expiry)
+            self.cache.move_to_end(key)
+            heapq.heappush(self._heap, (expiry, key))
+
+            # Evict oldest entry if cache is full
+            if len(self.cache) > self.max_size:
+                evicted_key, _ = self.cache.popitem(last=False)
+                self.evictions += 1
+                logger.debug(f"Cache full, evicted: {evicted_key}")
 
-        # Evict oldest entry if cache is full
-        if len(self.cache) > self.max_size:
-            evicted_key = next(iter(self.cache))
-            del self.cache[evicted_key]
-            logger.debug(f"Cache full, evicted: {evicted_key}")
+            # Rebuild the heap once stale pairs outnumber live entries; done
+            # under the lock so no live entry can lose its heap pair
+            if len(self._heap) > 2 * self.max_size:
+                self._heap = [(entry[1], k) for k, entry in self.cache.items()]
+                heapq.heapify(self._heap)
 
         logger.debug(f"Cached: {key} -> {addresses} (TTL={cache_ttl}s)")
 
     def clear(self):
         """Clear all cache entries"""
-        count = len(self.cache)
-        self.cache.clear()
+        with self._lock:
+            count = len(self.cache)
+            self.cache.clear()
+            self._heap.clear()
         logger.info(f"Cache cleared ({count} entries removed)")
 
     def remove(self, hostname: str, record_type: str = 'A'):
         """Remove specific entry from cache"""
         key = self._make_key(hostname, record_type)
-        if key in self.cache:
-            del self.cache[key]
+        with self._lock:
+            removed = self.cache.pop(key, None) is not None
+        if removed:
             logger.debug(f"Removed from cache: {key}")
 
     def stats(self) -> Dict[str, int]:
@@ -107,16 +169,21 @@ class DNSCache:
         valid_entries = 0
         expired_entries = 0
 
-        current_time = time.time()
-        for addresses, timestamp, ttl in self.cache.values():
-            if current_time - timestamp > ttl:
-                expired_entries += 1
-            else:
-                valid_entries += 1
-
-        return {
-            'total_entries': len(self.cache),
-            'valid_entries': valid_entries,
-            'expired_entries': expired_entries,
-            'max_size': self.max_size
-        }
+        with self._lock:
+            current_time = time.monotonic()
+            for addresses, expiry in self.cache.values():
+                if expiry <= current_time:
+                    expired_entries += 1
+                else:
+                    valid_entries += 1
+
+            return {
+                'total_entries': len(self.cache),
+                'valid_entries': valid_entries,
+                'expired_entries': expired_entries,
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
@@ -6,6 +6,7 @@ Resolves .chn and numeric domain names using IPv9 DNS servers.
 
 import socket
 import logging
+from functools import lru_cache
 import dns.resolver
 import dns.query
 import dns.message
@@ -15,17 +16,36 @@ from ..config import ConfigManager
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _classify_ipv9(hostname: str) -> bool:
+    """Memoized IPv9 hostname check (pure function of the hostname)"""
+    hostname = hostname.lower().strip()
+
+    # Check for .chn TLD
+    if hostname.endswith('.chn'):
+        return True
+
+    # Check if domain (before first dot) is all numeric
+    domain_part = hostname.split('.')[0]
+    if domain_part.isdigit():
+        return True
+
+    return False
+
+
 class IPv9Resolver:
     """DNS resolver for IPv9 decimal network domains"""
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, cache=None):
         """
         Initialize IPv9 DNS resolver
 
         Args:
             config: Configuration dictionary. If None, uses default config.
+            cache: Optional DNSCache shared with the caller, used by resolve_cached()
         """
         self.config = config or ConfigManager().get_config()
+        self.cache = cache
         self.primary_dns = self.config['dns']['primary']
         self.secondary_dns = self.config['dns']['secondary']
 
@@ -135,6 +155,33 @@ class IPv9Resolver:
                 logger.error(f"DNS resolution error for {hostname}: {e}")
             return []
 
+    def resolve_cached(self, hostname: str, record_type: str = 'A') -> List[str]:
+        """
+        Resolve through the shared cache, if one was given
+
+        Non-empty answers are stored so later lookups of the same name
+        (from any component sharing the cache) skip the DNS round-trip.
+
+        Args:
+            hostname: The .chn or numeric domain to resolve
+            record_type: DNS record type
+
+        Returns:
+            List of IP addresses or record values
+        """
+        cache = self.cache
+        if cache is None:
+            return self.resolve(hostname, record_type)
+
+        addresses = cache.get(hostname, record_type)
+        if addresses is not None:
+            return addresses
+
+        addresses = self.resolve(hostname, record_type)
+        if addresses:
+            cache.set(hostname, addresses, record_type)
+        return addresses
+
     def _query_dns(self, resolver: dns.resolver.Resolver, hostname: str, record_type: str) -> List[str]:
         """Query DNS and return results as list of strings"""
         try:
@@ -181,18 +228,7 @@ class IPv9Resolver:
         Returns:
             True if it's an IPv9 domain
         """
-        hostname = hostname.lower().strip()
-
-        # Check for .chn TLD
-        if hostname.endswith('.chn'):
-            return True
-
-        # Check if domain (before first dot) is all numeric
-        domain_part = hostname.split('.')[0]
-        if domain_part.isdigit():
-            return True
-
-        return False
+        return _classify_ipv9(hostname)
 
     def reverse_lookup(self, ip_address: str) -> Optional[str]:
         """
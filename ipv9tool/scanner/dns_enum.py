@@ -4,9 +4,10 @@ DNS Enumeration Module
 Enumerates IPv9 .chn domains and numeric hostnames.
 """
 
+import asyncio
 import logging
 import itertools
-from typing import List, Dict, Any, Optional, Iterator
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator, Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 logger = logging.getLogger(__name__)
@@ -31,7 +32,8 @@ class DNSEnumerator:
         Initialize DNS enumerator
 
         Args:
-            resolver: IPv9Resolver instance
+            resolver: IPv9Resolver instance; candidate lookups go through its
+                      shared cache, so hits warm it for other callers
             config: Configuration dictionary
         """
         from ..config import ConfigManager
@@ -66,7 +68,7 @@ class DNSEnumerator:
             hostname = f"{prefix}{num}.{tld}"
 
             # Resolve the hostname
-            addresses = self.resolver.resolve(hostname)
+            addresses = self.resolver.resolve_cached(hostname)
 
             if addresses:
                 results.append({
@@ -171,7 +173,7 @@ class DNSEnumerator:
 
         for word in wordlist:
             hostname = f"{word}.{tld}"
-            addresses = self.resolver.resolve(hostname)
+            addresses = self.resolver.resolve_cached(hostname)
 
             if addresses:
                 results.append({
@@ -184,11 +186,18 @@ class DNSEnumerator:
 
     def _enumerate_parallel(self, wordlist: List[str], tld: str) -> List[Dict[str, Any]]:
         """Parallel enumeration using thread pool"""
-        results = []
+        return list(self._iter_parallel(wordlist, tld))
+
+    def _iter_parallel(self, wordlist: List[str], tld: str) -> Iterator[Dict[str, Any]]:
+        """
+        Parallel enumeration yielding each hit as soon as it resolves
 
+        Up to max_threads lookups are in flight at once. Closing the
+        generator early cancels lookups that have not started yet.
+        """
         def resolve_word(word):
             hostname = f"{word}.{tld}"
-            addresses = self.resolver.resolve(hostname)
+            addresses = self.resolver.resolve_cached(hostname)
             if addresses:
                 return {
                     'hostname': hostname,
@@ -196,16 +205,17 @@ class DNSEnumerator:
                 }
             return None
 
-        with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
-            future_to_word = {executor.submit(resolve_word, word): word for word in wordlist}
+        executor = ThreadPoolExecutor(max_workers=self.max_threads)
+        try:
+            futures = [executor.submit(resolve_word, word) for word in wordlist]
 
-            for future in as_completed(future_to_word):
+            for future in as_completed(futures):
                 result = future.result()
                 if result:
-                    results.append(result)
                     logger.info(f"Found: {result['hostname']} -> {result['addresses']}")
-
-        return results
+                    yield result
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def generate_numeric_wordlist(self,
                                    length: int = 11,
@@ -265,6 +275,77 @@ class DNSEnumerator:
 
         return self.enumerate_wordlist(combinations, tld, parallel=True)
 
+    def iter_brute_force_pattern(self,
+                                 pattern: str,
+                                 tld: str = 'chn',
+                                 max_combinations: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Brute force with pattern, yielding hits in completion order
+
+        Same lookups as brute_force_pattern(), but callers can forward each
+        hit (e.g. as a streamed response line) while the rest resolve.
+
+        Args:
+            pattern: Pattern string (see brute_force_pattern)
+            tld: Top-level domain
+            max_combinations: Maximum combinations to try
+
+        Yields:
+            Found domains, one dict per hostname
+        """
+        logger.info(f"Brute forcing pattern: {pattern}")
+
+        combinations = self._generate_pattern_combinations(pattern, max_combinations)
+
+        logger.info(f"Generated {len(combinations)} combinations")
+
+        return self._iter_parallel(combinations, tld)
+
+    async def brute_force_pattern_async(self,
+                                        pattern: str,
+                                        tld: str = 'chn',
+                                        max_combinations: int = 1000,
+                                        chunk_size: int = 50,
+                                        progress_callback: Optional[Callable[[int, int], None]] = None
+                                        ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Brute force with pattern, streaming results as they are found
+
+        Combinations are resolved in chunks on a worker thread, so the
+        event loop stays responsive and callers can display hits before
+        the whole pattern has been tried.
+
+        Args:
+            pattern: Pattern string (see brute_force_pattern)
+            tld: Top-level domain
+            max_combinations: Maximum combinations to try
+            chunk_size: Number of combinations resolved per worker call
+            progress_callback: Called with (tried, total) after each chunk
+
+        Yields:
+            Found domains, one dict per hostname
+        """
+        logger.info(f"Brute forcing pattern: {pattern}")
+
+        combinations = self._generate_pattern_combinations(pattern, max_combinations)
+        total = len(combinations)
+
+        logger.info(f"Generated {total} combinations")
+
+        for start in range(0, total, chunk_size):
+            chunk = combinations[start:start + chunk_size]
+
+            if len(chunk) > 10:
+                results = await asyncio.to_thread(self._enumerate_parallel, chunk, tld)
+            else:
+                results = await asyncio.to_thread(self._enumerate_sequential, chunk, tld)
+
+            for result in results:
+                yield result
+
+            if progress_callback:
+                progress_callback(start + len(chunk), total)
+
     def _generate_pattern_combinations(self, pattern: str, max_count: int) -> List[str]:
         """Generate combinations from pattern"""
         # Find positions of N/X in pattern
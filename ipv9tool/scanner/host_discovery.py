@@ -7,10 +7,16 @@ Discovers active IPv9 hosts using ping and other techniques.
 import subprocess
 import logging
 import platform
+import threading
+import time
 from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Most of a probe's response body we will drain so the keep-alive
+# connection can go back to the pool; larger bodies close the connection
+_PROBE_DRAIN_LIMIT = 64 * 1024
+
 
 class HostDiscovery:
     """IPv9 host discovery functionality"""
@@ -28,6 +34,10 @@ class HostDiscovery:
         self.scanner_config = self.config.get('scanner', {})
         self.timeout = self.scanner_config.get('timeout', 5)
 
+        # Pooled HTTP client shared by every http_probe call (created lazily)
+        self._http_client = None
+        self._http_client_lock = threading.Lock()
+
     def ping(self, target: str, count: int = 4) -> Dict[str, Any]:
         """
         Ping an IPv9 host
@@ -194,6 +204,53 @@ class HostDiscovery:
                 'error': str(e)
             }
 
+    def _get_http_client(self):
+        """
+        Return the shared pooled HTTP client, creating it on first use
+
+        Keep-alive connections are reused across probes, so repeat probes
+        of the same host skip the TCP and TLS handshakes.
+        """
+        client = self._http_client
+        if client is not None:
+            return client
+
+        # Probes run from several threads; build exactly one client
+        with self._http_client_lock:
+            if self._http_client is None:
+                import httpx
+
+                # Certificates are not verified: probes target arbitrary hosts
+                self._http_client = httpx.Client(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    timeout=self.timeout,
+                    verify=False,
+                    follow_redirects=True,
+                    headers={'User-Agent': 'IPv9Scanner/1.0'}
+                )
+            return self._http_client
+
+    def close(self):
+        """Close the pooled HTTP client, if one was created"""
+        with self._http_client_lock:
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+
+    def _drain_probe_body(self, response, deadline: float):
+        """Read and discard up to _PROBE_DRAIN_LIMIT bytes of body before deadline"""
+        import httpx
+
+        received = 0
+        try:
+            for chunk in response.iter_raw():
+                received += len(chunk)
+                if received > _PROBE_DRAIN_LIMIT or time.time() > deadline:
+                    return
+        except httpx.TransportError:
+            # The headers already answered the probe; just lose the connection
+            pass
+
     def http_probe(self, target: str, port: int = 80, use_https: bool = False) -> Dict[str, Any]:
         """
         HTTP/HTTPS probe to check web service
@@ -206,9 +263,7 @@ class HostDiscovery:
         Returns:
             Dictionary with HTTP probe result
         """
-        import urllib.request
-        import urllib.error
-        import ssl
+        import httpx
 
         protocol = 'https' if use_https else 'http'
         url = f"{protocol}://{target}:{port}/"
@@ -216,40 +271,32 @@ class HostDiscovery:
         logger.debug(f"HTTP probe: {url}")
 
         try:
-            # Create SSL context that doesn't verify certificates (for testing)
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-
-            req = urllib.request.Request(url, headers={'User-Agent': 'IPv9Scanner/1.0'})
-
-            start_time = __import__('time').time()
-            response = urllib.request.urlopen(req, timeout=self.timeout, context=ctx)
-            end_time = __import__('time').time()
-
-            return {
-                'target': target,
-                'url': url,
-                'reachable': True,
-                'status_code': response.getcode(),
-                'response_time_ms': (end_time - start_time) * 1000,
-                'server': response.headers.get('Server')
-            }
-
-        except urllib.error.HTTPError as e:
-            return {
-                'target': target,
-                'url': url,
-                'reachable': True,
-                'status_code': e.code,
-                'error': str(e)
-            }
-        except urllib.error.URLError as e:
+            start_time = time.time()
+            # Only the status line and headers are needed. A small body is
+            # drained (and discarded) so the connection stays reusable;
+            # anything larger or slower is cut off by closing the response
+            with self._get_http_client().stream('GET', url) as response:
+                end_time = time.time()
+                self._drain_probe_body(response, end_time + self.timeout)
+
+                result = {
+                    'target': target,
+                    'url': url,
+                    'reachable': True,
+                    'status_code': response.status_code,
+                    'response_time_ms': (end_time - start_time) * 1000,
+                    'server': response.headers.get('Server')
+                }
+                if response.is_error:
+                    result['error'] = f"HTTP Error {response.status_code}: {response.reason_phrase}"
+            return result
+
+        except httpx.TransportError as e:
             return {
                 'target': target,
                 'url': url,
                 'reachable': False,
-                'error': str(e.reason)
+                'error': str(e)
             }
         except Exception as e:
             logger.error(f"HTTP probe failed for {url}: {e}")
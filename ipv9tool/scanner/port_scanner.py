@@ -4,15 +4,74 @@ Port Scanner Module
 Scans IPv9 hosts for open ports and services using nmap/masscan.
 """
 
+import asyncio
+import io
+import mmap
+import os
+import re
+import shutil
 import subprocess
-import json
+import threading
 import logging
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Any, Optional
+import orjson
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Callable, Tuple, Iterator
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Port lists used by quick scans (already sorted, as nmap prefers)
+_COMMON_PORTS = "21,22,23,25,53,80,110,111,135,139,143,443,445,993,995,1723,3306,3389,5900,8080"
+_TOP_100 = "1-100"
+
+# One element of an nmap -p list: optional protocol prefix, then a port
+# range (either bound may be omitted), a single port, or a service name
+# (which may use * and ? wildcards)
+_PORT_ITEM_RE = re.compile(
+    r'(?:[TUSP]:)?(?:(\d{1,5})?-(\d{1,5})?|(\d{1,5})|([A-Za-z0-9*?_][A-Za-z0-9*?_-]*))'
+)
+
+
+@lru_cache(maxsize=256)
+def normalize_port_spec(spec: str) -> Optional[str]:
+    """
+    Validate an nmap port specification such as "1-1000,3306,U:53,http*"
+
+    Cached per distinct spec, since clients resend the same few lists.
+
+    Args:
+        spec: Comma-separated ports, ranges ("-1024", "1-", "-") or service
+              names, optionally prefixed T:/U:/S:/P:
+
+    Returns:
+        The spec with whitespace removed, or None if it is malformed or out
+        of the 0-65535 range
+    """
+    items = spec.replace(' ', '').split(',')
+
+    for item in items:
+        match = _PORT_ITEM_RE.fullmatch(item)
+        if match is None:
+            return None
+
+        if match[4] is not None:
+            # Service name; nmap resolves it against nmap-services
+            continue
+
+        if match[3] is not None:
+            if int(match[3]) > 65535:
+                return None
+            continue
+
+        # Range; open ends default to the first/last port
+        start = int(match[1]) if match[1] else 0
+        end = int(match[2]) if match[2] else 65535
+        if end > 65535 or start > end:
+            return None
+
+    return ','.join(items)
+
 
 class PortScanner:
     """Port scanning functionality for IPv9 hosts"""
@@ -31,20 +90,37 @@ class PortScanner:
         self.rate_limit = self.scanner_config.get('rate_limit', 100)
         self.timeout = self.scanner_config.get('timeout', 5)
 
-    def check_nmap_installed(self) -> bool:
-        """Check if nmap is installed"""
-        try:
-            result = subprocess.run(['nmap', '--version'],
-                                    capture_output=True,
-                                    timeout=5)
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        # Optional CPU list (taskset syntax, e.g. "0-7") to pin nmap/masscan to
+        self.cpu_affinity = self.scanner_config.get('cpu_affinity')
+
+    def check_nmap_installed(self, verify_version: bool = False) -> bool:
+        """
+        Check if nmap is installed
+
+        Args:
+            verify_version: Also run `nmap --version` instead of only
+                            looking the binary up on PATH
+        """
+        if not verify_version:
+            return shutil.which('nmap') is not None
+        return self._probe_version('nmap')
+
+    def check_masscan_installed(self, verify_version: bool = False) -> bool:
+        """
+        Check if masscan is installed
+
+        Args:
+            verify_version: Also run `masscan --version` instead of only
+                            looking the binary up on PATH
+        """
+        if not verify_version:
+            return shutil.which('masscan') is not None
+        return self._probe_version('masscan')
 
-    def check_masscan_installed(self) -> bool:
-        """Check if masscan is installed"""
+    def _probe_version(self, binary: str) -> bool:
+        """Run `<binary> --version` and report whether it succeeded"""
         try:
-            result = subprocess.run(['masscan', '--version'],
+            result = subprocess.run([binary, '--version'],
                                     capture_output=True,
                                     timeout=5)
             return result.returncode == 0
@@ -56,7 +132,8 @@ class PortScanner:
                   ports: str = "1-1000",
                   scan_type: str = "syn",
                   service_detection: bool = True,
-                  os_detection: bool = False) -> Dict[str, Any]:
+                  os_detection: bool = False,
+                  output_to_tmpfile: bool = False) -> Dict[str, Any]:
         """
         Scan target using nmap
 
@@ -66,6 +143,8 @@ class PortScanner:
             scan_type: Scan type (syn, tcp, udp, ack)
             service_detection: Enable service version detection
             os_detection: Enable OS detection
+            output_to_tmpfile: Have nmap write XML to a temp file that is
+                               mmap-ed for parsing (for very large scans)
 
         Returns:
             Dictionary with scan results
@@ -74,8 +153,267 @@ class PortScanner:
             logger.error("nmap is not installed")
             return {'error': 'nmap not installed'}
 
-        # Build nmap command
-        cmd = ['nmap']
+        if output_to_tmpfile:
+            return self._scan_nmap_tmpfile(target, ports, scan_type,
+                                           service_detection, os_detection)
+
+        cmd = self._build_nmap_cmd(ports, scan_type, service_detection, os_detection)
+
+        # Target
+        cmd.append(target)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Running nmap: %s", ' '.join(cmd))
+
+        try:
+            # Parse hosts as nmap emits them instead of buffering the XML
+            scan_results, returncode, stderr = self._stream_subprocess(
+                cmd, self._parse_nmap_xml_stream, self.timeout * 10)
+
+            if returncode != 0:
+                logger.error("nmap failed: %s", stderr)
+                return {'error': stderr}
+
+            scan_results['target'] = target
+            scan_results['ports_scanned'] = ports
+
+            return scan_results
+
+        except subprocess.TimeoutExpired:
+            logger.error("nmap scan timed out for %s", target)
+            return {'error': 'scan timeout'}
+        except Exception as e:
+            logger.error("nmap scan failed: %s", e)
+            return {'error': str(e)}
+
+    def scan_nmap_stream(self,
+                         target: str,
+                         ports: str = "1-1000",
+                         scan_type: str = "syn",
+                         service_detection: bool = True,
+                         os_detection: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Scan target using nmap, yielding each host as nmap finishes it
+
+        nmap writes a host's XML block (ports included) once that host is
+        done, so multi-host targets (ranges, CIDRs) produce results long
+        before the whole scan completes. Closing the generator kills nmap.
+
+        Args:
+            target: IP address, hostname or range
+            ports: Port range (e.g., "1-1000", "80,443,8080")
+            scan_type: Scan type (syn, tcp, udp, ack)
+            service_detection: Enable service version detection
+            os_detection: Enable OS detection
+
+        Yields:
+            Host dicts in the same format as scan_nmap()['hosts'] entries;
+            a final {'error': ...} dict if the scan fails
+        """
+        if not self.check_nmap_installed():
+            logger.error("nmap is not installed")
+            yield {'error': 'nmap not installed'}
+            return
+
+        cmd = self._build_nmap_cmd(ports, scan_type, service_detection, os_detection)
+        cmd.append(target)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Running nmap: %s", ' '.join(cmd))
+
+        timeout = self.timeout * 10
+        proc = subprocess.Popen(cmd,
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE,
+                                bufsize=1 << 20)
+        stderr_chunks = []
+        stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()),
+                                         daemon=True)
+        stderr_reader.start()
+        watchdog, expired = self._start_watchdog(proc, timeout)
+        parse_error = None
+
+        try:
+            try:
+                for _, elem in ET.iterparse(proc.stdout, events=('end',)):
+                    if elem.tag == 'host':
+                        host_data = self._parse_nmap_host(elem)
+                        elem.clear()
+                        yield host_data
+            except ET.ParseError as e:
+                parse_error = e
+
+            proc.stdout.close()
+            proc.wait()
+        finally:
+            # Also reached when the consumer closes the generator early
+            watchdog.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            stderr_reader.join()
+
+        if expired.is_set():
+            logger.error("nmap scan timed out for %s", target)
+            yield {'error': 'scan timeout'}
+        elif proc.returncode != 0:
+            error = b''.join(stderr_chunks).decode(errors='replace')
+            logger.error("nmap failed: %s", error)
+            yield {'error': error}
+        elif parse_error is not None:
+            logger.error("Failed to parse nmap XML: %s", parse_error)
+            yield {'error': 'XML parse error'}
+
+    def _scan_nmap_tmpfile(self,
+                           target: str,
+                           ports: str,
+                           scan_type: str,
+                           service_detection: bool,
+                           os_detection: bool) -> Dict[str, Any]:
+        """
+        Run scan_nmap with XML written to a temp file instead of stdout
+
+        The file is mmap-ed and parsed in place, so multi-MB reports are
+        never copied through a pipe into a Python bytes object.
+        """
+        import tempfile
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.xml') as f:
+            xml_file = f.name
+
+        try:
+            cmd = self._build_nmap_cmd(ports, scan_type, service_detection,
+                                       os_detection, output_file=xml_file)
+            cmd.append(target)
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Running nmap: %s", ' '.join(cmd))
+
+            # XML goes to the file; nmap's normal output is not needed
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=self.timeout * 10,
+                text=True
+            )
+
+            if result.returncode != 0:
+                logger.error("nmap failed: %s", result.stderr)
+                return {'error': result.stderr}
+
+            scan_results = self._parse_nmap_xml_file(xml_file)
+            scan_results['target'] = target
+            scan_results['ports_scanned'] = ports
+
+            return scan_results
+
+        except subprocess.TimeoutExpired:
+            logger.error("nmap scan timed out for %s", target)
+            return {'error': 'scan timeout'}
+        except Exception as e:
+            logger.error("nmap scan failed: %s", e)
+            return {'error': str(e)}
+        finally:
+            # Clean up temp file
+            Path(xml_file).unlink(missing_ok=True)
+
+    async def scan_nmap_async(self,
+                              target: str,
+                              ports: str = "1-1000",
+                              scan_type: str = "syn",
+                              service_detection: bool = True,
+                              os_detection: bool = False) -> Dict[str, Any]:
+        """
+        Scan target using nmap without blocking the event loop
+
+        Same arguments and result format as scan_nmap(). If the awaiting
+        task is cancelled, the nmap process is killed.
+
+        Returns:
+            Dictionary with scan results
+        """
+        if not self.check_nmap_installed():
+            logger.error("nmap is not installed")
+            return {'error': 'nmap not installed'}
+
+        cmd = self._build_nmap_cmd(ports, scan_type, service_detection, os_detection)
+        cmd.append(target)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Running nmap: %s", ' '.join(cmd))
+
+        try:
+            proc = await asyncio.create_subprocess_exec(*cmd,
+                                                        stdout=asyncio.subprocess.PIPE,
+                                                        stderr=asyncio.subprocess.PIPE)
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(),
+                                                        timeout=self.timeout * 10)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                proc.kill()
+                await proc.wait()
+                raise
+
+            if proc.returncode != 0:
+                error = stderr.decode(errors='replace')
+                logger.error("nmap failed: %s", error)
+                return {'error': error}
+
+            # Parse XML output
+            scan_results = self._parse_nmap_xml(stdout)
+            scan_results['target'] = target
+            scan_results['ports_scanned'] = ports
+
+            return scan_results
+
+        except asyncio.TimeoutError:
+            logger.error("nmap scan timed out for %s", target)
+            return {'error': 'scan timeout'}
+        except asyncio.CancelledError:
+            logger.warning("nmap scan cancelled for %s", target)
+            raise
+        except Exception as e:
+            logger.error("nmap scan failed: %s", e)
+            return {'error': str(e)}
+
+    async def scan_nmap_many_async(self,
+                                   targets: List[str],
+                                   concurrency: Optional[int] = None,
+                                   **kwargs) -> List[Dict[str, Any]]:
+        """
+        Run concurrent nmap scans, one process per target
+
+        Args:
+            targets: IP addresses or hostnames
+            concurrency: Maximum simultaneous nmap processes
+                         (default: scanner.max_threads)
+            **kwargs: Passed through to scan_nmap_async()
+
+        Returns:
+            List of scan results in the same order as targets
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.scanner_config.get('max_threads', 10))
+
+        async def _bounded_scan(target: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.scan_nmap_async(target, **kwargs)
+
+        return await asyncio.gather(*(_bounded_scan(target) for target in targets))
+
+    def _affinity_prefix(self) -> List[str]:
+        """Return the taskset prefix pinning scanners to scanner.cpu_affinity, if set"""
+        if self.cpu_affinity:
+            return ['taskset', '-c', str(self.cpu_affinity)]
+        return []
+
+    def _build_nmap_cmd(self,
+                        ports: str,
+                        scan_type: str,
+                        service_detection: bool,
+                        os_detection: bool,
+                        output_file: Optional[str] = None) -> List[str]:
+        """Build the nmap argv shared by single and batch scans (without targets)"""
+        cmd = self._affinity_prefix() + ['nmap']
 
         # Scan type
         if scan_type == 'syn':
@@ -104,126 +442,204 @@ class PortScanner:
         # Timeout
         cmd.extend(['--host-timeout', f'{self.timeout}s'])
 
-        # Output format (XML for parsing)
-        cmd.extend(['-oX', '-'])
+        # Output format (XML for parsing), to stdout unless a file is given
+        cmd.extend(['-oX', output_file or '-'])
 
         # Skip host discovery (assume host is up)
         cmd.append('-Pn')
 
-        # Target
-        cmd.append(target)
+        return cmd
 
-        logger.info(f"Running nmap: {' '.join(cmd)}")
+    def scan_nmap_batch(self,
+                        targets: List[str],
+                        ports: str = "1-1000",
+                        scan_type: str = "syn",
+                        service_detection: bool = True,
+                        os_detection: bool = False,
+                        max_batch: int = 256) -> Dict[str, Any]:
+        """
+        Scan many targets with one nmap process per batch
 
-        try:
-            result = subprocess.run(cmd,
-                                    capture_output=True,
-                                    timeout=self.timeout * 10,
-                                    text=True)
+        Targets are fed to nmap on stdin (-iL -) so process startup and
+        nmap's own ramp-up are paid once per batch instead of once per host.
+
+        Args:
+            targets: IP addresses or hostnames
+            ports: Port range (e.g., "1-1000", "80,443,8080")
+            scan_type: Scan type (syn, tcp, udp, ack)
+            service_detection: Enable service version detection
+            os_detection: Enable OS detection
+            max_batch: Maximum targets per nmap invocation
+
+        Returns:
+            Dictionary with combined scan results
+        """
+        if not self.check_nmap_installed():
+            logger.error("nmap is not installed")
+            return {'error': 'nmap not installed'}
+
+        cmd = self._build_nmap_cmd(ports, scan_type, service_detection, os_detection)
+        cmd.extend(['-iL', '-'])
+
+        combined = {
+            'hosts': [],
+            'scan_info': {},
+            'targets': list(targets),
+            'ports_scanned': ports
+        }
+
+        for start in range(0, len(targets), max_batch):
+            batch = targets[start:start + max_batch]
+            logger.info("Running nmap batch of %s targets", len(batch))
+
+            try:
+                result = subprocess.run(cmd,
+                                        input='\n'.join(batch) + '\n',
+                                        capture_output=True,
+                                        timeout=self.timeout * 10 * len(batch),
+                                        text=True)
+            except subprocess.TimeoutExpired:
+                logger.error("nmap batch timed out (%s targets)", len(batch))
+                return {'error': 'scan timeout'}
+            except Exception as e:
+                logger.error("nmap batch scan failed: %s", e)
+                return {'error': str(e)}
 
             if result.returncode != 0:
-                logger.error(f"nmap failed: {result.stderr}")
+                logger.error("nmap failed: %s", result.stderr)
                 return {'error': result.stderr}
 
-            # Parse XML output
-            scan_results = self._parse_nmap_xml(result.stdout)
-            scan_results['target'] = target
-            scan_results['ports_scanned'] = ports
+            batch_results = self._parse_nmap_xml(result.stdout)
+            if 'error' in batch_results:
+                return batch_results
 
-            return scan_results
+            combined['hosts'].extend(batch_results['hosts'])
+            combined['scan_info'] = batch_results['scan_info'] or combined['scan_info']
 
-        except subprocess.TimeoutExpired:
-            logger.error(f"nmap scan timed out for {target}")
-            return {'error': 'scan timeout'}
-        except Exception as e:
-            logger.error(f"nmap scan failed: {e}")
-            return {'error': str(e)}
+        return combined
 
-    def _parse_nmap_xml(self, xml_data: str) -> Dict[str, Any]:
-        """Parse nmap XML output"""
-        try:
-            root = ET.fromstring(xml_data)
-
-            results = {
-                'hosts': [],
-                'scan_info': {}
-            }
-
-            # Parse scan info
-            scaninfo = root.find('scaninfo')
-            if scaninfo is not None:
-                results['scan_info'] = {
-                    'type': scaninfo.get('type'),
-                    'protocol': scaninfo.get('protocol'),
-                    'services': scaninfo.get('services')
-                }
+    def _parse_nmap_xml(self, xml_data) -> Dict[str, Any]:
+        """Parse nmap XML output held in memory (str or bytes)"""
+        if isinstance(xml_data, str):
+            xml_data = xml_data.encode()
+        return self._parse_nmap_xml_stream(io.BytesIO(xml_data))
 
-            # Parse hosts
-            for host in root.findall('host'):
-                host_data = {
-                    'addresses': [],
-                    'hostnames': [],
-                    'ports': [],
-                    'os': None
-                }
+    def _parse_nmap_xml_file(self, path: str) -> Dict[str, Any]:
+        """Parse an nmap XML report on disk through a read-only mmap"""
+        with open(path, 'rb') as f:
+            # mmap cannot map an empty file; nmap wrote nothing
+            if os.fstat(f.fileno()).st_size == 0:
+                logger.error("Failed to parse nmap XML: empty output")
+                return {'error': 'XML parse error'}
 
-                # Addresses
-                for addr in host.findall('address'):
-                    host_data['addresses'].append({
-                        'addr': addr.get('addr'),
-                        'type': addr.get('addrtype')
-                    })
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return self._parse_nmap_xml_stream(mm)
 
-                # Hostnames
-                hostnames = host.find('hostnames')
-                if hostnames is not None:
-                    for hostname in hostnames.findall('hostname'):
-                        host_data['hostnames'].append({
-                            'name': hostname.get('name'),
-                            'type': hostname.get('type')
-                        })
-
-                # Ports
-                ports = host.find('ports')
-                if ports is not None:
-                    for port in ports.findall('port'):
-                        state = port.find('state')
-                        service = port.find('service')
-
-                        port_data = {
-                            'port': int(port.get('portid')),
-                            'protocol': port.get('protocol'),
-                            'state': state.get('state') if state is not None else 'unknown'
-                        }
+    def _parse_nmap_xml_stream(self, fileobj) -> Dict[str, Any]:
+        """
+        Parse nmap XML output incrementally
 
-                        if service is not None:
-                            port_data['service'] = {
-                                'name': service.get('name'),
-                                'product': service.get('product'),
-                                'version': service.get('version'),
-                                'extrainfo': service.get('extrainfo')
-                            }
-
-                        host_data['ports'].append(port_data)
-
-                # OS detection
-                os_elem = host.find('os')
-                if os_elem is not None:
-                    osmatch = os_elem.find('osmatch')
-                    if osmatch is not None:
-                        host_data['os'] = {
-                            'name': osmatch.get('name'),
-                            'accuracy': osmatch.get('accuracy')
-                        }
+        Each <host> element is converted and cleared as soon as it closes,
+        so memory stays proportional to one host rather than the whole
+        document.
+
+        Args:
+            fileobj: Binary file object (e.g. the nmap stdout pipe)
+        """
+        results = {
+            'hosts': [],
+            'scan_info': {}
+        }
+        append = results['hosts'].append
+
+        try:
+            for _, elem in ET.iterparse(fileobj, events=('end',)):
+                tag = elem.tag
 
-                results['hosts'].append(host_data)
+                if tag == 'host':
+                    append(self._parse_nmap_host(elem))
+                    elem.clear()
+
+                elif tag == 'scaninfo':
+                    # Parse scan info
+                    results['scan_info'] = {
+                        'type': elem.get('type'),
+                        'protocol': elem.get('protocol'),
+                        'services': elem.get('services')
+                    }
 
             return results
 
         except ET.ParseError as e:
-            logger.error(f"Failed to parse nmap XML: {e}")
+            logger.error("Failed to parse nmap XML: %s", e)
             return {'error': 'XML parse error'}
 
+    def _parse_nmap_host(self, host: ET.Element) -> Dict[str, Any]:
+        """Convert one nmap <host> element to a result dict"""
+        host_data = {
+            'addresses': [],
+            'hostnames': [],
+            'ports': [],
+            'os': None
+        }
+
+        # Addresses
+        for addr in host.findall('address'):
+            host_data['addresses'].append({
+                'addr': addr.get('addr'),
+                'type': addr.get('addrtype')
+            })
+
+        # Hostnames
+        hostnames = host.find('hostnames')
+        if hostnames is not None:
+            for hostname in hostnames.findall('hostname'):
+                host_data['hostnames'].append({
+                    'name': hostname.get('name'),
+                    'type': hostname.get('type')
+                })
+
+        # Ports: this loop runs once per port (65k per host on full
+        # scans), so it walks each <port>'s children once instead of
+        # calling find() per child tag
+        ports = host.find('ports')
+        if ports is not None:
+            append_port = host_data['ports'].append
+            for port in ports.iterfind('port'):
+                attrib = port.attrib
+                port_data = {
+                    'port': int(attrib['portid']),
+                    'protocol': attrib.get('protocol'),
+                    'state': 'unknown'
+                }
+
+                for child in port:
+                    tag = child.tag
+                    if tag == 'state':
+                        port_data['state'] = child.get('state')
+                    elif tag == 'service':
+                        service = child.attrib
+                        port_data['service'] = {
+                            'name': service.get('name'),
+                            'product': service.get('product'),
+                            'version': service.get('version'),
+                            'extrainfo': service.get('extrainfo')
+                        }
+
+                append_port(port_data)
+
+        # OS detection
+        os_elem = host.find('os')
+        if os_elem is not None:
+            osmatch = os_elem.find('osmatch')
+            if osmatch is not None:
+                host_data['os'] = {
+                    'name': osmatch.get('name'),
+                    'accuracy': osmatch.get('accuracy')
+                }
+
+        return host_data
+
     def scan_masscan(self,
                      targets: List[str],
                      ports: str = "1-1000") -> Dict[str, Any]:
@@ -250,7 +666,7 @@ class PortScanner:
 
         try:
             # Build masscan command
-            cmd = [
+            cmd = self._affinity_prefix() + [
                 'masscan',
                 '-iL', target_file,
                 '-p', ports,
@@ -258,19 +674,16 @@ class PortScanner:
                 '-oJ', '-'  # JSON output to stdout
             ]
 
-            logger.info(f"Running masscan on {len(targets)} targets")
+            logger.info("Running masscan on %s targets", len(targets))
 
-            result = subprocess.run(cmd,
-                                    capture_output=True,
-                                    timeout=self.timeout * 10,
-                                    text=True)
+            # Stream stdout so JSON parsing overlaps with the scan itself
+            scan_results, returncode, stderr = self._stream_subprocess(
+                cmd, self._parse_masscan_stream, self.timeout * 10)
 
-            if result.returncode != 0:
-                logger.error(f"masscan failed: {result.stderr}")
-                return {'error': result.stderr}
+            if returncode != 0:
+                logger.error("masscan failed: %s", stderr)
+                return {'error': stderr}
 
-            # Parse JSON output
-            scan_results = self._parse_masscan_json(result.stdout)
             scan_results['targets_count'] = len(targets)
             scan_results['ports_scanned'] = ports
 
@@ -280,42 +693,120 @@ class PortScanner:
             logger.error("masscan timed out")
             return {'error': 'scan timeout'}
         except Exception as e:
-            logger.error(f"masscan failed: {e}")
+            logger.error("masscan failed: %s", e)
             return {'error': str(e)}
         finally:
             # Clean up temp file
             Path(target_file).unlink(missing_ok=True)
 
+    def _stream_subprocess(self,
+                           cmd: List[str],
+                           parser: Callable[[Any], Dict[str, Any]],
+                           timeout: float) -> Tuple[Dict[str, Any], int, str]:
+        """
+        Run a scanner, feeding its stdout pipe to parser while it runs
+
+        Args:
+            cmd: Command to run
+            parser: Callable consuming the binary stdout file object
+            timeout: Timeout in seconds
+
+        Returns:
+            Tuple of (parser result, return code, stderr text)
+
+        Raises:
+            subprocess.TimeoutExpired: If the process outlived the timeout
+        """
+        proc = subprocess.Popen(cmd,
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE,
+                                bufsize=1 << 20)
+        stderr_chunks = []
+        stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()),
+                                         daemon=True)
+        stderr_reader.start()
+        watchdog, expired = self._start_watchdog(proc, timeout)
+
+        try:
+            parsed = parser(proc.stdout)
+            # Closing early (e.g. after a parse error) stops the scanner via SIGPIPE
+            proc.stdout.close()
+            proc.wait()
+        except BaseException:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            watchdog.cancel()
+            stderr_reader.join()
+
+        if expired.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        return parsed, proc.returncode, b''.join(stderr_chunks).decode(errors='replace')
+
+    def _start_watchdog(self, proc: subprocess.Popen, timeout: float):
+        """
+        Kill a streaming subprocess if it outlives its timeout
+
+        Args:
+            proc: Running process
+            timeout: Timeout in seconds
+
+        Returns:
+            Tuple of (timer, event set when the timeout fired)
+        """
+        expired = threading.Event()
+
+        def _expire():
+            expired.set()
+            proc.kill()
+
+        watchdog = threading.Timer(timeout, _expire)
+        watchdog.daemon = True
+        watchdog.start()
+        return watchdog, expired
+
     def _parse_masscan_json(self, json_data: str) -> Dict[str, Any]:
         """Parse masscan JSON output"""
+        return self._parse_masscan_stream(json_data.encode().splitlines())
+
+    def _parse_masscan_stream(self, fileobj) -> Dict[str, Any]:
+        """
+        Parse masscan JSON output incrementally
+
+        Args:
+            fileobj: Binary file object (e.g. the masscan stdout pipe) or any
+                     iterable of byte lines
+        """
         results = {
             'hosts': []
         }
+        append = results['hosts'].append
 
         try:
             # masscan outputs one JSON object per line
-            for line in json_data.strip().split('\n'):
-                if not line.strip():
+            for line in fileobj:
+                line = line.strip()
+                if not line or line[:1] in (b'[', b']', b'#'):
                     continue
 
                 try:
-                    entry = json.loads(line)
-
-                    if 'ip' in entry and 'ports' in entry:
-                        host_data = {
-                            'ip': entry['ip'],
-                            'ports': entry['ports']
-                        }
-                        results['hosts'].append(host_data)
-
-                except json.JSONDecodeError:
+                    entry = orjson.loads(line.rstrip(b','))
+                except orjson.JSONDecodeError:
                     continue
 
-            logger.info(f"masscan found {len(results['hosts'])} hosts with open ports")
+                if 'ip' in entry and 'ports' in entry:
+                    append({
+                        'ip': entry['ip'],
+                        'ports': entry['ports']
+                    })
+
+            logger.info("masscan found %s hosts with open ports", len(results['hosts']))
             return results
 
         except Exception as e:
-            logger.error(f"Failed to parse masscan JSON: {e}")
+            logger.error("Failed to parse masscan JSON: %s", e)
             return {'error': 'JSON parse error'}
 
     def quick_scan(self, target: str, common_ports: bool = True) -> Dict[str, Any]:
@@ -329,9 +820,19 @@ class PortScanner:
         Returns:
             Scan results
         """
-        if common_ports:
-            ports = "21,22,23,25,53,80,110,111,135,139,143,443,445,993,995,1723,3306,3389,5900,8080"
-        else:
-            ports = "1-100"
+        return self.scan_nmap(target, ports=_COMMON_PORTS if common_ports else _TOP_100,
+                              service_detection=True)
 
-        return self.scan_nmap(target, ports=ports, service_detection=True)
+    def quick_scan_many(self, targets: List[str], common_ports: bool = True) -> Dict[str, Any]:
+        """
+        Quick scan of common ports across many targets in batched nmap runs
+
+        Args:
+            targets: IPs or hostnames
+            common_ports: Use common port list vs top 100
+
+        Returns:
+            Combined scan results
+        """
+        return self.scan_nmap_batch(targets, ports=_COMMON_PORTS if common_ports else _TOP_100,
+                                    service_detection=True)
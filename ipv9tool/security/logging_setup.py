@@ -2,13 +2,54 @@
 Logging Setup for IPv9 Tool
 
 Configures logging with rotation and audit trails.
+
+Loggers only enqueue records; a background QueueListener owns the real
+console/file handlers so disk I/O stays off the scanning hot path.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+
+# Active queue listeners, stopped at interpreter exit
+_listeners: List[logging.handlers.QueueListener] = []
+_root_listener = None
+
+
+def _start_queue_listener(*handlers: logging.Handler) -> Tuple[logging.handlers.QueueHandler,
+                                                                logging.handlers.QueueListener]:
+    """
+    Start a background listener that owns the given handlers
+
+    Args:
+        *handlers: Handlers that perform the actual output
+
+    Returns:
+        Tuple of (QueueHandler feeding the listener, the listener)
+    """
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+    return logging.handlers.QueueHandler(log_queue), listener
+
+
+def _stop_queue_listener(listener: logging.handlers.QueueListener):
+    """Flush and stop a queue listener"""
+    if listener in _listeners:
+        _listeners.remove(listener)
+        listener.stop()
+
+
+@atexit.register
+def _stop_all_listeners():
+    """Flush pending records on interpreter exit"""
+    for listener in list(_listeners):
+        _stop_queue_listener(listener)
 
 
 def setup_logging(config: Dict[str, Any]):
@@ -18,6 +59,8 @@ def setup_logging(config: Dict[str, Any]):
     Args:
         config: Logging configuration dictionary
     """
+    global _root_listener
+
     log_file = config.get('file', '/var/log/ipv9tool.log')
     log_format = config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     log_level = config.get('log_level', 'INFO')
@@ -42,14 +85,19 @@ def setup_logging(config: Dict[str, Any]):
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
+    if _root_listener is not None:
+        _stop_queue_listener(_root_listener)
+        _root_listener = None
+
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.WARNING)  # Only warnings and above to console
     console_formatter = logging.Formatter('%(levelname)s: %(message)s')
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler with rotation
+    file_logging = True
     try:
         file_handler = logging.handlers.RotatingFileHandler(
             log_file,
@@ -59,12 +107,19 @@ def setup_logging(config: Dict[str, Any]):
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(log_format)
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
-
-        root_logger.info(f"Logging initialized: {log_file}")
+        handlers.append(file_handler)
 
     except PermissionError:
-        root_logger.warning(f"Cannot write to {log_file}, logging to console only")
+        file_logging = False
+
+    # Root logger only enqueues; the listener thread does the writing
+    queue_handler, _root_listener = _start_queue_listener(*handlers)
+    root_logger.addHandler(queue_handler)
+
+    if file_logging:
+        root_logger.info("Logging initialized: %s", log_file)
+    else:
+        root_logger.warning("Cannot write to %s, logging to console only", log_file)
 
 
 def get_audit_logger(name: str = 'ipv9.audit') -> logging.Logger:
@@ -79,6 +134,11 @@ def get_audit_logger(name: str = 'ipv9.audit') -> logging.Logger:
     """
     audit_logger = logging.getLogger(name)
 
+    # Already configured by an earlier call; attaching another handler
+    # would write every audit line once per call
+    if audit_logger.handlers:
+        return audit_logger
+
     # Create separate audit log file
     audit_file = os.path.expanduser('~/.ipv9tool/audit.log')
     audit_dir = Path(audit_file).parent
@@ -95,7 +155,11 @@ def get_audit_logger(name: str = 'ipv9.audit') -> logging.Logger:
         '%(asctime)s - AUDIT - %(levelname)s - %(message)s'
     )
     handler.setFormatter(formatter)
-    audit_logger.addHandler(handler)
+    queue_handler, _ = _start_queue_listener(handler)
+    audit_logger.addHandler(queue_handler)
     audit_logger.setLevel(logging.INFO)
 
+    # Audit records go to the audit file only, not through root as well
+    audit_logger.propagate = False
+
     return audit_logger
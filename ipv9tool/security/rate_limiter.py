@@ -11,6 +11,8 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+_monotonic = time.monotonic
+
 
 class RateLimiter:
     """Token bucket rate limiter"""
@@ -28,15 +30,22 @@ class RateLimiter:
         self.per = per
         self.burst = burst or rate
         self.allowance = float(self.burst)
-        self.last_check = time.time()
+        self.last_check = _monotonic()
         self.lock = threading.Lock()
 
-        logger.info(f"Rate limiter initialized: {rate} ops/{per}s (burst={self.burst})")
+        # Precomputed conversion factors for the acquire paths
+        self._tokens_per_sec = self.rate / self.per
+        self._sec_per_token = self.per / self.rate
+
+        logger.info("Rate limiter initialized: %s ops/%ss (burst=%s)", rate, per, self.burst)
 
     def acquire(self, tokens: int = 1, blocking: bool = True) -> bool:
         """
         Acquire tokens from the bucket
 
+        The default single-token blocking call takes a specialised fast
+        path; anything else is handled by acquire_n().
+
         Args:
             tokens: Number of tokens to acquire
             blocking: If True, wait until tokens are available
@@ -44,17 +53,40 @@ class RateLimiter:
         Returns:
             True if tokens acquired, False otherwise
         """
+        if tokens != 1 or not blocking:
+            return self.acquire_n(tokens, blocking)
+
         with self.lock:
-            current = time.time()
-            time_passed = current - self.last_check
-            self.last_check = current
+            now = _monotonic()
+            allowance = self.allowance + (now - self.last_check) * self._tokens_per_sec
+            self.last_check = now
+
+            if allowance > self.burst:
+                allowance = float(self.burst)
+
+            # Take the token even if it is not there yet; a negative
+            # allowance queues later callers behind this one
+            self.allowance = allowance - 1.0
 
-            # Add tokens based on time passed
-            self.allowance += time_passed * (self.rate / self.per)
+        if allowance >= 1.0:
+            return True
+
+        time.sleep((1.0 - allowance) * self._sec_per_token)
+        return True
 
-            # Cap at burst size
-            if self.allowance > self.burst:
-                self.allowance = float(self.burst)
+    def acquire_n(self, tokens: int, blocking: bool = True) -> bool:
+        """
+        Acquire an arbitrary number of tokens from the bucket
+
+        Args:
+            tokens: Number of tokens to acquire
+            blocking: If True, wait until tokens are available
+
+        Returns:
+            True if tokens acquired, False otherwise
+        """
+        with self.lock:
+            self._refill(_monotonic())
 
             # Check if we have enough tokens
             if self.allowance >= tokens:
@@ -64,14 +96,25 @@ class RateLimiter:
             if not blocking:
                 return False
 
-        # Blocking mode: wait for tokens
-        wait_time = (tokens - self.allowance) * (self.per / self.rate)
-        logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
+            # Reserve the tokens up front so concurrent waiters queue behind
+            # each other instead of all waking at once
+            deficit = tokens - self.allowance
+            self.allowance -= tokens
+
+        # Blocking mode: sleep off the deficit without holding the lock
+        wait_time = deficit * self._sec_per_token
+        logger.debug("Rate limit reached, waiting %.2fs", wait_time)
         time.sleep(wait_time)
+        return True
 
-        with self.lock:
-            self.allowance = 0  # Consumed waiting time
-            return True
+    def _refill(self, now: float):
+        """Add tokens accrued since the last check (caller must hold the lock)"""
+        self.allowance += (now - self.last_check) * self._tokens_per_sec
+        self.last_check = now
+
+        # Cap at burst size
+        if self.allowance > self.burst:
+            self.allowance = float(self.burst)
 
     def __enter__(self):
         """Context manager entry"""
@@ -86,7 +129,7 @@ class RateLimiter:
         """Reset the rate limiter"""
         with self.lock:
             self.allowance = float(self.burst)
-            self.last_check = time.time()
+            self.last_check = _monotonic()
         logger.debug("Rate limiter reset")
 
     def get_status(self) -> dict:
@@ -97,5 +140,5 @@ class RateLimiter:
                 'per': self.per,
                 'burst': self.burst,
                 'current_allowance': self.allowance,
-                'available_tokens': int(self.allowance)
+                'available_tokens': max(int(self.allowance), 0)
             }
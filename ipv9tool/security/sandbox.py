@@ -25,6 +25,10 @@ class Sandbox:
         self.enabled = enable
         self.original_uid = os.getuid() if hasattr(os, 'getuid') else None
 
+        # Host capabilities are static; probe them once (the netns check
+        # forks `ip`) and serve check_capabilities() from the cache
+        self._caps = self._probe_capabilities()
+
         if self.enabled:
             logger.info("Sandbox enabled")
         else:
@@ -68,10 +72,13 @@ class Sandbox:
             os.setgid(gid)
             os.setuid(uid)
 
-            logger.info(f"Dropped privileges to {user}:{group} (uid={uid}, gid={gid})")
+            logger.info("Dropped privileges to %s:%s (uid=%s, gid=%s)", user, group, uid, gid)
+
+            # drop_privileges is no longer available
+            self.refresh_capabilities()
 
         except Exception as e:
-            logger.error(f"Failed to drop privileges: {e}")
+            logger.error("Failed to drop privileges: %s", e)
             raise
 
     def run_isolated(self,
@@ -103,7 +110,8 @@ class Sandbox:
         if env:
             restricted_env.update(env)
 
-        logger.debug(f"Running isolated: {' '.join(command)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running isolated: %s", ' '.join(command))
 
         try:
             result = subprocess.run(
@@ -117,10 +125,10 @@ class Sandbox:
             return result
 
         except subprocess.TimeoutExpired as e:
-            logger.error(f"Command timed out: {' '.join(command)}")
+            logger.error("Command timed out: %s", ' '.join(command))
             raise
         except Exception as e:
-            logger.error(f"Isolated execution failed: {e}")
+            logger.error("Isolated execution failed: %s", e)
             raise
 
     def check_capabilities(self) -> Dict[str, bool]:
@@ -130,6 +138,20 @@ class Sandbox:
         Returns:
             Dictionary of available capabilities
         """
+        return dict(self._caps)
+
+    def refresh_capabilities(self) -> Dict[str, bool]:
+        """
+        Re-probe security capabilities, e.g. after the host changed
+
+        Returns:
+            Dictionary of available capabilities
+        """
+        self._caps = self._probe_capabilities()
+        return dict(self._caps)
+
+    def _probe_capabilities(self) -> Dict[str, bool]:
+        """Probe the host for available security capabilities"""
         capabilities = {
             'drop_privileges': hasattr(os, 'setuid') and os.getuid() == 0,
             'network_namespace': self._check_network_namespace(),
@@ -138,7 +160,7 @@ class Sandbox:
             'selinux': self._check_selinux()
         }
 
-        logger.info(f"Security capabilities: {capabilities}")
+        logger.info("Security capabilities: %s", capabilities)
         return capabilities
 
     def _check_network_namespace(self) -> bool:
@@ -184,11 +206,11 @@ class Sandbox:
                 check=True,
                 timeout=5
             )
-            logger.info(f"Created network namespace: {name}")
+            logger.info("Created network namespace: %s", name)
             return True
 
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
-            logger.error(f"Failed to create network namespace: {e}")
+            logger.error("Failed to create network namespace: %s", e)
             return False
 
     def delete_network_namespace(self, name: str) -> bool:
@@ -207,9 +229,9 @@ class Sandbox:
                 check=True,
                 timeout=5
             )
-            logger.info(f"Deleted network namespace: {name}")
+            logger.info("Deleted network namespace: %s", name)
             return True
 
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
-            logger.error(f"Failed to delete network namespace: {e}")
+            logger.error("Failed to delete network namespace: %s", e)
             return False
@@ -4,10 +4,21 @@ TUI Logging Handler
 
 Custom logging handler that captures log messages and forwards them
 to the TUI military log widget for real-time display.
+
+Records are pushed onto a bounded ring buffer that the TUI drains on a
+timer, so logging from scanner threads never waits on widget rendering.
 """
 
 import logging
-from typing import Optional, Callable
+from collections import deque
+from typing import Optional, Callable, Deque, Tuple
+
+
+# TUI level names indexed by record.levelno // 10 (saturating at CRITICAL)
+_LEVEL_NAMES = ('NOTSET', 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+# Third-party loggers that are chatty below WARNING while a scan runs
+_NOISY_LOGGERS = ('asyncio', 'aiosqlite', 'urllib3', 'httpx')
 
 
 class TUILogHandler(logging.Handler):
@@ -18,19 +29,33 @@ class TUILogHandler(logging.Handler):
     tactical log widget with appropriate severity levels.
     """
 
-    def __init__(self, log_callback: Callable[[str, str], None]):
+    def __init__(self, log_callback: Callable[[Tuple[str, str]], None]):
         """
         Initialize TUI log handler
 
         Args:
-            log_callback: Function to call with (message, level) for each log entry
+            log_callback: Function to call with a (message, level) tuple for
+                          each log entry (typically a deque's append)
         """
         super().__init__()
         self.log_callback = log_callback
 
-        # Set format
-        formatter = logging.Formatter('%(message)s')
-        self.setFormatter(formatter)
+    def handle(self, record: logging.LogRecord):
+        """
+        Filter and emit a record without taking the handler lock
+
+        emit() only appends to a deque, which is atomic under the GIL,
+        so the per-record RLock round-trip of Handler.handle is skipped.
+
+        Args:
+            record: Log record to handle
+        """
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
 
     def emit(self, record: logging.LogRecord):
         """
@@ -40,43 +65,45 @@ class TUILogHandler(logging.Handler):
             record: Log record to emit
         """
         try:
-            # Map Python logging levels to TUI levels
-            level_map = {
-                logging.DEBUG: "DEBUG",
-                logging.INFO: "INFO",
-                logging.WARNING: "WARNING",
-                logging.ERROR: "ERROR",
-                logging.CRITICAL: "CRITICAL"
-            }
+            log_callback = self.log_callback
 
             # Get TUI level
-            tui_level = level_map.get(record.levelno, "INFO")
+            tui_level = _LEVEL_NAMES[min(record.levelno // 10, 5)]
 
-            # Format message
-            message = self.format(record)
+            # Plain message; only go through the formatter when a
+            # traceback has to be rendered
+            if record.exc_info:
+                message = self.format(record)
+            else:
+                message = record.getMessage()
 
             # Send to TUI callback
-            if self.log_callback:
-                self.log_callback(message, tui_level)
+            if log_callback:
+                log_callback((message, tui_level))
 
         except Exception:
             self.handleError(record)
 
 
-def setup_tui_logging(log_callback: Callable[[str, str], None],
-                      level: int = logging.INFO) -> TUILogHandler:
+def setup_tui_logging(level: int = logging.INFO,
+                      maxlen: int = 4096) -> Tuple[TUILogHandler, Deque[Tuple[str, str]]]:
     """
     Setup TUI logging handler
 
     Args:
-        log_callback: Function to call with (message, level) for each log entry
         level: Minimum logging level
+        maxlen: Ring buffer capacity; the oldest entries are dropped on overflow
 
     Returns:
-        TUILogHandler instance
+        Tuple of (TUILogHandler instance, ring buffer of (message, level)
+        tuples for the TUI to drain)
     """
+    # deque.append/popleft are atomic under the GIL, so producers and the
+    # UI thread need no extra lock
+    ring: Deque[Tuple[str, str]] = deque(maxlen=maxlen)
+
     # Create handler
-    handler = TUILogHandler(log_callback)
+    handler = TUILogHandler(ring.append)
     handler.setLevel(level)
 
     # Get root logger
@@ -93,4 +120,8 @@ def setup_tui_logging(log_callback: Callable[[str, str], None],
     # Ensure propagation is enabled
     ipv9_logger.propagate = False
 
-    return handler
+    # Keep dependency chatter from reaching the root handlers mid-scan
+    for name in _NOISY_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    return handler, ring
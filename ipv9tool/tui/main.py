@@ -9,13 +9,17 @@ Facility: TACTICAL NETWORK OPERATIONS CENTER (TNOC)
 
 import asyncio
 import logging
-from datetime import datetime, timezone
-from typing import Optional
+import re
+import threading
+import time
+from functools import cached_property
+from types import SimpleNamespace
+from typing import List, Optional
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer, Grid
 from textual.widgets import (
-    Header, Footer, Button, Static, Log, Input,
+    Header, Footer, Button, Static, RichLog, Input,
     Label, ProgressBar, DataTable, TabbedContent, TabPane
 )
 from textual.binding import Binding
@@ -34,20 +38,66 @@ from ..security import setup_logging
 from .logging_handler import setup_tui_logging
 
 
+# IPv4 dotted quad or IPv6 literal (needs a colon, so hex-only names like
+# "cafe" still go through DNS); targets that don't match are resolved
+_IP_LITERAL_RE = re.compile(r'(?:\d{1,3}\.){3}\d{1,3}|[0-9a-fA-F]*:[0-9a-fA-F:.]*')
+
+# Echo requests sent per PING action
+_PING_COUNT = 4
+
+
+def _host_record(address: str, hostname: Optional[str]) -> SimpleNamespace:
+    """Minimal host_info for DatabaseManager.store_host (no ports or OS data)"""
+    return SimpleNamespace(address=address, hostname=hostname, ports=[],
+                           os=None, os_accuracy=None)
+
+
+# Python logging levels shown as-is in the tactical log (others -> INFO)
+_MODULE_LOG_LEVELS = frozenset(("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"))
+
+# AuditEngine.run_full_audit reports only a percentage; name the phase it ends
+_AUDIT_PHASES = {
+    20.0: "DNS INFRASTRUCTURE",
+    40.0: "DOMAIN ENUMERATION",
+    60.0: "HOST DISCOVERY",
+    80.0: "PORT SCANNING",
+    90.0: "DEEP INSPECTION",
+    100.0: "ANALYSIS",
+}
+
+
+# Full-width rule used by the banner and classification footer
+_RULE = "█" * 120
+
+_FOOTER_MARKUP = (
+    f"[bold green]{_RULE}\n"
+    "  CLASSIFICATION: UNCLASSIFIED  │  FACILITY: TNOC  │  SYSTEM: IPVNINER\n"
+    f"{_RULE}[/bold green]"
+)
+
+
+def _build_banner_text() -> Text:
+    """Build the static classification banner"""
+    banner = Text()
+    banner.append(_RULE, style="bold green")
+    banner.append("\n")
+    banner.append("  CLASSIFICATION: UNCLASSIFIED  ", style="bold black on green")
+    banner.append("  SYSTEM: IPVNINER NETWORK INTELLIGENCE PLATFORM  ", style="bold green")
+    banner.append("  FACILITY: TNOC  ", style="bold black on green")
+    banner.append("\n")
+    banner.append(_RULE, style="bold green")
+    return banner
+
+
+_BANNER_TEXT = _build_banner_text()
+
+
 class SecurityBanner(Static):
     """TEMPEST-compliant security classification banner"""
 
     def render(self) -> Text:
         """Render security banner"""
-        banner = Text()
-        banner.append("█" * 120, style="bold green")
-        banner.append("\n")
-        banner.append("  CLASSIFICATION: UNCLASSIFIED  ", style="bold black on green")
-        banner.append("  SYSTEM: IPVNINER NETWORK INTELLIGENCE PLATFORM  ", style="bold green")
-        banner.append("  FACILITY: TNOC  ", style="bold black on green")
-        banner.append("\n")
-        banner.append("█" * 120, style="bold green")
-        return banner
+        return _BANNER_TEXT
 
 
 class SystemStatusWidget(Static):
@@ -57,30 +107,35 @@ class SystemStatusWidget(Static):
         super().__init__()
         self.status = "OPERATIONAL"
         self.integrity = "SECURE"
-        self.uptime_start = datetime.now(timezone.utc)
+        self._start_mono = time.monotonic()
+
+        # The panel is assembled once; tick() only rewrites these two cells
+        self._zulu_cell = Text(style="bold yellow")
+        self._uptime_cell = Text(style="bold cyan")
+        self._panel = self._build_panel()
+        self._update_clock()
 
     def get_zulu_time(self) -> str:
         """Get current time in Zulu (UTC) format"""
-        return datetime.now(timezone.utc).strftime("%d%H%M%SZMAY%y")
+        return time.strftime("%d%H%M%SZ%b%y", time.gmtime()).upper()
 
     def get_uptime(self) -> str:
         """Calculate system uptime"""
-        delta = datetime.now(timezone.utc) - self.uptime_start
-        hours = int(delta.total_seconds() // 3600)
-        minutes = int((delta.total_seconds() % 3600) // 60)
-        seconds = int(delta.total_seconds() % 60)
+        elapsed = int(time.monotonic() - self._start_mono)
+        hours, rem = divmod(elapsed, 3600)
+        minutes, seconds = divmod(rem, 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
-    def render(self) -> Panel:
-        """Render system status panel"""
+    def _build_panel(self) -> Panel:
+        """Build the status panel around the live clock cells"""
         table = RichTable.grid(padding=(0, 2))
         table.add_column(style="bold green", justify="right")
         table.add_column(style="bold white")
 
         table.add_row("SYS STATUS:", f"[bold green]█ {self.status}[/bold green]")
         table.add_row("INTEGRITY:", f"[bold green]█ {self.integrity}[/bold green]")
-        table.add_row("ZULU TIME:", f"[bold yellow]{self.get_zulu_time()}[/bold yellow]")
-        table.add_row("UPTIME:", f"[bold cyan]{self.get_uptime()}[/bold cyan]")
+        table.add_row("ZULU TIME:", self._zulu_cell)
+        table.add_row("UPTIME:", self._uptime_cell)
 
         return Panel(
             table,
@@ -89,6 +144,20 @@ class SystemStatusWidget(Static):
             padding=(0, 1)
         )
 
+    def _update_clock(self) -> None:
+        """Write the current time and uptime into the clock cells"""
+        self._zulu_cell.plain = self.get_zulu_time()
+        self._uptime_cell.plain = self.get_uptime()
+
+    def tick(self) -> None:
+        """Advance the clock and repaint"""
+        self._update_clock()
+        self.refresh()
+
+    def render(self) -> Panel:
+        """Render system status panel"""
+        return self._panel
+
 
 class TacticalStatsWidget(Static):
     """Tactical network statistics display"""
@@ -104,13 +173,28 @@ class TacticalStatsWidget(Static):
             'threats': 0
         }
 
+        # Last built panel; rebuilt only after the stats change
+        self._panel: Optional[Panel] = None
+
     def update_stats(self, stats: dict):
         """Update statistics"""
-        self.stats.update(stats)
+        stats_now = self.stats
+        if all(stats_now.get(key) == value for key, value in stats.items()):
+            # Counters unchanged; keep the cached panel and skip the repaint
+            return
+
+        stats_now.update(stats)
+        self._panel = None
         self.refresh()
 
     def render(self) -> Panel:
         """Render tactical statistics"""
+        if self._panel is None:
+            self._panel = self._build_panel()
+        return self._panel
+
+    def _build_panel(self) -> Panel:
+        """Build the statistics panel from the current stats"""
         table = RichTable.grid(padding=(0, 2))
         table.add_column(style="bold green", justify="right", width=20)
         table.add_column(style="bold yellow", justify="right", width=10)
@@ -130,39 +214,75 @@ class TacticalStatsWidget(Static):
         )
 
 
-class MilitaryLogWidget(Log):
+class MilitaryLogWidget(RichLog):
     """Military-styled log output with tactical formatting"""
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs, highlight=True, markup=True)
-        self.max_lines = 5000
+    # Level indicators with military styling: (style, "symbol CODE" segment)
+    _LEVEL_STYLES = {
+        level: (style, f"{symbol} {code:3}")
+        for level, (style, code, symbol) in {
+            "ERROR": ("bold red", "ERR", "█"),
+            "WARNING": ("bold yellow", "WRN", "▲"),
+            "SUCCESS": ("bold green", "OPS", "✓"),
+            "INFO": ("bold cyan", "INF", "►"),
+            "DEBUG": ("dim white", "DBG", "·"),
+            "CRITICAL": ("bold red on white", "CRT", "█"),
+            "OPERATIONAL": ("bold green", "OPR", "●"),
+            "SECURE": ("bold green", "SEC", "■"),
+        }.items()
+    }
+    _DEFAULT_STYLE = ("white", "○ LOG")
 
-    def write_log(self, message: str, level: str = "INFO"):
-        """Write military-formatted log message"""
-        # Zulu timestamp
-        timestamp = datetime.now(timezone.utc).strftime("%H%M%SZ")
-
-        # Level indicators with military styling
-        level_styles = {
-            "ERROR": ("[bold red]", "ERR", "█"),
-            "WARNING": ("[bold yellow]", "WRN", "▲"),
-            "SUCCESS": ("[bold green]", "OPS", "✓"),
-            "INFO": ("[bold cyan]", "INF", "►"),
-            "DEBUG": ("[dim white]", "DBG", "·"),
-            "CRITICAL": ("[bold red on white]", "CRT", "█"),
-            "OPERATIONAL": ("[bold green]", "OPR", "●"),
-            "SECURE": ("[bold green]", "SEC", "■"),
-        }
+    def __init__(self, **kwargs):
+        # Lines arrive as pre-styled Text, so neither markup parsing nor
+        # highlighting is needed; keep only the most recent lines
+        super().__init__(**kwargs, max_lines=1000, highlight=False, markup=False)
 
-        style, code, symbol = level_styles.get(level, ("[white]", "LOG", "○"))
+        # Lines written since the last flush; handlers that log in tight
+        # loops cost one widget update per batch instead of one per line
+        self._pending: List[Text] = []
+        self._flush_scheduled = False
 
-        log_line = (
-            f"[dim green]{timestamp}[/dim green] "
-            f"{style}{symbol} {code:3}[/{style[1:-1]}] "
-            f"[white]{message}[/white]"
-        )
+        # Last formatted timestamp and the epoch second it belongs to
+        self._ts_sec = -1
+        self._ts_str = ""
 
-        self.write(log_line)
+    def write_log(self, message: str, level: str = "INFO"):
+        """Write military-formatted log message"""
+        # Zulu timestamp, formatted at most once per second so bursts of
+        # lines share one strftime
+        now_s = int(time.time())
+        if now_s != self._ts_sec:
+            self._ts_sec = now_s
+            self._ts_str = time.strftime("%H%M%SZ", time.gmtime(now_s))
+        timestamp = self._ts_str
+
+        style, indicator = self._LEVEL_STYLES.get(level, self._DEFAULT_STYLE)
+
+        # Styled segments directly, so no markup is parsed per line (and
+        # brackets in messages are shown verbatim)
+        log_line = Text(timestamp, style="dim green")
+        log_line.append(" ")
+        log_line.append(indicator, style=style)
+        log_line.append(" ")
+        log_line.append(message, style="white")
+
+        self._pending.append(log_line)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.set_timer(0.05, self._flush)
+
+    def _flush(self) -> None:
+        """Write all pending lines in a single update"""
+        self._flush_scheduled = False
+        if self._pending:
+            lines, self._pending = self._pending, []
+            self.write(Text("\n").join(lines))
+
+    def clear(self):
+        """Clear the log, dropping lines not yet flushed"""
+        self._pending.clear()
+        return super().clear()
 
 
 class OperationalControlPanel(Container):
@@ -208,253 +328,8 @@ class OperationalControlPanel(Container):
 class IPv9MilitaryTUI(App):
     """TEMPEST-Compliant IPv9 Network Intelligence Platform"""
 
-    CSS = """
-    /* TEMPEST-Compliant Military Theme */
-
-    Screen {
-        background: #000000;
-        color: #00ff00;
-    }
-
-    Header {
-        background: #001100;
-        color: #00ff00;
-        height: 1;
-        text-style: bold;
-    }
-
-    Footer {
-        background: #001100;
-        color: #00ff00;
-        text-style: bold;
-    }
-
-    SecurityBanner {
-        height: 3;
-        background: #000000;
-        color: #00ff00;
-        text-style: bold;
-    }
-
-    #top-status-bar {
-        layout: horizontal;
-        height: 8;
-        background: #000000;
-        margin-bottom: 1;
-    }
-
-    SystemStatusWidget {
-        width: 1fr;
-        height: 100%;
-        border: solid #00ff00;
-        background: #001100;
-    }
-
-    TacticalStatsWidget {
-        width: 2fr;
-        height: 100%;
-        border: solid #00ff00;
-        background: #001100;
-        margin-left: 1;
-    }
-
-    OperationalControlPanel {
-        height: auto;
-        background: #000000;
-        margin-top: 1;
-        margin-bottom: 1;
-    }
-
-    #control-header, #control-footer {
-        height: 1;
-        background: #000000;
-    }
-
-    .button-row, .input-row {
-        height: 3;
-        background: #000000;
-        padding: 0 1;
-    }
-
-    #progress-container {
-        height: 3;
-        background: #000000;
-        padding: 0 1;
-    }
-
-    .section-label {
-        width: 15;
-        content-align: center middle;
-        text-style: bold;
-        color: #00ff00;
-        background: #000000;
-    }
-
-    .input-label {
-        width: 10;
-        content-align: right middle;
-        text-style: bold;
-        color: #00ff00;
-        background: #000000;
-    }
-
-    Button.mil-button {
-        min-width: 15;
-        height: 2;
-        background: #003300;
-        color: #00ff00;
-        border: solid #00ff00;
-        text-style: bold;
-        margin: 0 1;
-    }
-
-    Button.mil-button:hover {
-        background: #005500;
-        color: #ffffff;
-        border: solid #00ff00;
-        text-style: bold;
-    }
-
-    Button.mil-button:focus {
-        background: #007700;
-        color: #ffffff;
-        border: double #00ff00;
-        text-style: bold;
-    }
-
-    Input.mil-input {
-        width: 2fr;
-        height: 1;
-        background: #001100;
-        color: #00ff00;
-        border: solid #00ff00;
-        padding: 0 1;
-    }
-
-    Input.mil-input-small {
-        width: 1fr;
-        height: 1;
-        background: #001100;
-        color: #00ff00;
-        border: solid #00ff00;
-        padding: 0 1;
-    }
-
-    Input:focus {
-        border: double #00ff00;
-        background: #002200;
-    }
-
-    ProgressBar.mil-progress {
-        height: 1;
-        background: #001100;
-        color: #00ff00;
-        border: solid #00ff00;
-        margin-left: 16;
-    }
-
-    ProgressBar > .bar--bar {
-        color: #00ff00;
-        background: #00ff00;
-    }
-
-    ProgressBar > .bar--complete {
-        color: #00ff00;
-    }
-
-    #log-container {
-        height: 1fr;
-        border: double #00ff00;
-        background: #000000;
-        margin-top: 1;
-    }
-
-    MilitaryLogWidget {
-        background: #000000;
-        color: #00ff00;
-        border: none;
-        scrollbar-background: #001100;
-        scrollbar-color: #00ff00;
-    }
-
-    TabbedContent {
-        background: #000000;
-        height: 100%;
-    }
-
-    TabPane {
-        background: #000000;
-        padding: 0;
-    }
-
-    Tabs {
-        background: #001100;
-        color: #00ff00;
-    }
-
-    Tab {
-        background: #001100;
-        color: #00ff00;
-        text-style: bold;
-    }
-
-    Tab:hover {
-        background: #003300;
-        color: #ffffff;
-    }
-
-    Tab.-active {
-        background: #005500;
-        color: #ffffff;
-        text-style: bold;
-    }
-
-    DataTable {
-        height: 100%;
-        background: #000000;
-        color: #00ff00;
-        border: solid #00ff00;
-    }
-
-    DataTable > .datatable--header {
-        background: #003300;
-        color: #ffffff;
-        text-style: bold;
-    }
-
-    DataTable > .datatable--cursor {
-        background: #005500;
-        color: #ffffff;
-        text-style: bold;
-    }
-
-    DataTable > .datatable--fixed {
-        background: #001100;
-    }
-
-    DataTable:focus > .datatable--cursor {
-        background: #007700;
-        color: #ffffff;
-        text-style: bold;
-    }
-
-    Label {
-        background: transparent;
-        color: #00ff00;
-    }
-
-    Static {
-        background: transparent;
-    }
-
-    .classification-footer {
-        height: 1;
-        background: #000000;
-        color: #00ff00;
-        text-align: center;
-        text-style: bold;
-    }
-    """
+    # Theme lives in main.tcss next to this module rather than an inline string
+    CSS_PATH = "main.tcss"
 
     BINDINGS = [
         Binding("q", "quit", "ABORT", priority=True),
@@ -477,15 +352,14 @@ class IPv9MilitaryTUI(App):
 
         setup_logging(self.config.get('logging', {}))
 
-        self.resolver = IPv9Resolver(self.config)
         self.cache = DNSCache(
             max_size=self.config['dns']['cache_size'],
             default_ttl=self.config['dns']['ttl']
         )
+        self.resolver = IPv9Resolver(self.config, cache=self.cache)
         self.scanner = PortScanner(self.config)
         self.discovery = HostDiscovery(self.config)
         self.enumerator = DNSEnumerator(self.resolver, self.config)
-        self.masscan_enum = MasscanEnumerator(rate=10000)
 
         # Initialize database (will be done async)
         self.db = None
@@ -496,14 +370,32 @@ class IPv9MilitaryTUI(App):
         self.stats_widget = None
         self.log_widget = None
         self.progress_bar = None
+        self.target_input = None
+        self.ports_input = None
+        self.hosts_table = None
+        self.ports_table = None
+        self.domains_table = None
 
         # State
         self.scanning = False
         self.current_job = None
         self.mission_number = 1000
+        self._db_dirty = False
+        self._ui_thread = None
 
-        # TUI logging handler (will be setup after mount)
+        # TUI logging handler and its ring buffer (will be setup after mount)
         self.tui_log_handler = None
+        self.log_ring = None
+
+    @cached_property
+    def masscan_enum(self) -> MasscanEnumerator:
+        """
+        Masscan enumerator, created on first use
+
+        Its constructor forks `masscan --version`, so the cost is only paid
+        by sessions that actually start a masscan operation.
+        """
+        return MasscanEnumerator(rate=10000)
 
     def compose(self) -> ComposeResult:
         """Compose military-grade UI"""
@@ -533,32 +425,37 @@ class IPv9MilitaryTUI(App):
             with TabPane("█ DOMAIN DB █", id="tab-domains"):
                 yield DataTable(id="domains-table")
 
-        yield Static("[bold green]█" * 120 + "\n  CLASSIFICATION: UNCLASSIFIED  │  FACILITY: TNOC  │  SYSTEM: IPVNINER\n" + "█" * 120 + "[/bold green]", classes="classification-footer")
+        yield Static(_FOOTER_MARKUP, classes="classification-footer")
         yield Footer()
 
     async def on_mount(self) -> None:
         """Initialize tactical system after mount"""
+        # Thread the app (and all widget updates) runs on
+        self._ui_thread = threading.get_ident()
+
         # Get widget references
         self.system_status = self.query_one(SystemStatusWidget)
         self.stats_widget = self.query_one(TacticalStatsWidget)
         self.log_widget = self.query_one("#log-stream", MilitaryLogWidget)
         self.progress_bar = self.query_one("#progress", ProgressBar)
+        self.target_input = self.query_one("#target-input", Input)
+        self.ports_input = self.query_one("#ports-input", Input)
 
         # Setup TUI logging to capture verbose output
-        self.tui_log_handler = setup_tui_logging(
-            log_callback=self.handle_log_message,
+        self.tui_log_handler, self.log_ring = setup_tui_logging(
             level=logging.INFO  # Capture INFO and above
         )
+        self.set_interval(0.05, self.drain_log_ring)
 
         # Setup data tables
-        hosts_table = self.query_one("#hosts-table", DataTable)
-        hosts_table.add_columns("IP ADDRESS", "HOSTNAME", "STATUS", "OS TYPE", "LAST CONTACT")
+        self.hosts_table = self.query_one("#hosts-table", DataTable)
+        self.hosts_table.add_columns("IP ADDRESS", "HOSTNAME", "STATUS", "OS TYPE", "LAST CONTACT")
 
-        ports_table = self.query_one("#ports-table", DataTable)
-        ports_table.add_columns("HOST", "PORT", "PROTOCOL", "STATE", "SERVICE", "VERSION")
+        self.ports_table = self.query_one("#ports-table", DataTable)
+        self.ports_table.add_columns("HOST", "PORT", "PROTOCOL", "STATE", "SERVICE", "VERSION")
 
-        domains_table = self.query_one("#domains-table", DataTable)
-        domains_table.add_columns("HOSTNAME", "IP ADDRESSES", "STATUS", "HTTP CODE", "THREAT")
+        self.domains_table = self.query_one("#domains-table", DataTable)
+        self.domains_table.add_columns("HOSTNAME", "IP ADDRESSES", "STATUS", "HTTP CODE", "THREAT")
 
         # Initialize database
         self.log_widget.write_log("INITIALIZING TACTICAL DATABASE...", "INFO")
@@ -579,52 +476,173 @@ class IPv9MilitaryTUI(App):
         self.log_widget.write_log("AWAITING TACTICAL DIRECTIVES...", "INFO")
         self.log_widget.write_log("TEMPEST COMPLIANCE: VERIFIED", "SECURE")
 
-        # Load initial stats
+        # Load initial stats and tables
         await self.refresh_stats()
+        await self.refresh_hosts_table()
+        await self.refresh_ports_table()
 
         # Start status update timer
         self.set_interval(1.0, self.update_system_status)
 
-    def handle_log_message(self, message: str, level: str):
-        """
-        Handle log messages from modules
+        # Handlers only mark the database dirty; views refresh at most
+        # twice a second
+        self.set_interval(0.5, self._maybe_refresh_views)
 
-        This callback is called by the TUI logging handler to forward
-        log messages to the tactical log widget.
+    def drain_log_ring(self) -> None:
+        """Forward buffered module log records to the tactical log widget"""
+        ring = self.log_ring
+        if not ring or not self.log_widget:
+            return
 
-        Args:
-            message: Log message
-            level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        """
-        if self.log_widget:
-            # Map Python logging levels to TUI levels
-            level_map = {
-                "DEBUG": "DEBUG",
-                "INFO": "INFO",
-                "WARNING": "WARNING",
-                "ERROR": "ERROR",
-                "CRITICAL": "CRITICAL"
-            }
-
-            tui_level = level_map.get(level, "INFO")
-            self.log_widget.write_log(message, tui_level)
+        # Python logging levels map onto TUI levels of the same name. A
+        # busy scan can buffer hundreds of records per tick, all of which
+        # land in one batched widget write
+        write_log = self.log_widget.write_log
+        popleft = ring.popleft
+        for _ in range(len(ring)):
+            message, level = popleft()
+            write_log(message, level if level in _MODULE_LOG_LEVELS else "INFO")
 
     async def update_system_status(self) -> None:
         """Update system status display"""
         if self.system_status:
-            self.system_status.refresh()
+            self.system_status.tick()
 
     async def refresh_stats(self) -> None:
         """Refresh tactical statistics"""
         if self.db:
-            stats = await self.db.get_statistics()
+            stats = await self.db.get_stats()
             if self.stats_widget:
                 self.stats_widget.update_stats(stats)
 
+    def _apply_progress(self, progress: float) -> None:
+        """Advance the progress bar and log the audit phase just completed"""
+        self.progress_bar.update(progress=progress)
+        phase = _AUDIT_PHASES.get(progress, "IN PROGRESS")
+        self.log_widget.write_log(f"AUDIT PHASE: {phase} ({progress:.1f}%)", "INFO")
+
+    def _job_running(self) -> bool:
+        """Log and return True if a long-running operation is still active"""
+        if self.current_job and not self.current_job.done():
+            self.log_widget.write_log("ERROR: OPERATION IN PROGRESS - ABORT IT FIRST", "ERROR")
+            return True
+        return False
+
+    def _start_job(self, job) -> None:
+        """
+        Run a long-running operation as its own task
+
+        The button handler returns at once, so the app keeps processing
+        input while the job runs and STOP can cancel it via current_job.
+        Subprocesses (nmap, masscan) are killed on cancellation; work
+        already handed to a thread stops at its next await.
+        """
+        self.scanning = True
+        self.current_job = asyncio.create_task(job)
+
+    def _finish_job(self) -> None:
+        """Clear job state; called from each job's finally block"""
+        self.scanning = False
+        self.current_job = None
+
+    async def _cached_resolve(self, target: str) -> List[str]:
+        """
+        Resolve target off the event loop through the shared DNS cache
+
+        Repeated button presses on the same target skip the DNS round-trip
+        until the configured dns.ttl expires.
+        """
+        addresses = self.cache.get(target)
+        if addresses is not None:
+            return addresses
+
+        addresses = await asyncio.to_thread(self.resolver.resolve, target)
+
+        # Don't pin failed lookups for a full TTL
+        if addresses:
+            self.cache.set(target, addresses)
+
+        return addresses
+
+    def _schedule_stats_refresh(self) -> None:
+        """Refresh statistics in a worker; a new request replaces one in flight"""
+        self.run_worker(self._refresh_stats_reported(), exclusive=True, group="stats")
+
+    async def _refresh_stats_reported(self) -> None:
+        """Refresh statistics, reporting failures in the tactical log"""
+        try:
+            await self.refresh_stats()
+        except Exception as e:
+            self.log_widget.write_log(f"STATISTICS REFRESH FAILED - {str(e)}", "ERROR")
+
+    async def _maybe_refresh_views(self) -> None:
+        """
+        Refresh statistics and result tables if handlers wrote to the database
+
+        Handlers never touch these widgets directly; they only set
+        _db_dirty, so a burst of writes costs one query and one redraw per
+        view per tick.
+        """
+        if self._db_dirty:
+            self._db_dirty = False
+            await self.refresh_stats()
+            await self.refresh_hosts_table()
+            await self.refresh_ports_table()
+
+    async def refresh_hosts_table(self) -> None:
+        """Reload the hostile net table from the database"""
+        if not self.db:
+            return
+
+        hosts = await self.db.get_hosts(alive_only=False, limit=100)
+
+        rows = [
+            (
+                host['ip_address'],
+                host['hostname'] or 'N/A',
+                'ACTIVE' if host['alive'] else 'DARK',
+                host['os'] or 'UNKNOWN',
+                str(host['last_seen'])
+            )
+            for host in hosts
+        ]
+
+        # Clear and refill as one screen update
+        with self.batch_update():
+            self.hosts_table.clear()
+            self.hosts_table.add_rows(rows)
+
+    async def refresh_ports_table(self) -> None:
+        """Reload the port intel table from the database"""
+        if not self.db:
+            return
+
+        ports = await self.db.get_ports(limit=100)
+
+        # One host lookup for the whole table, not one per port row
+        host_map = await self.db.get_host_ip_map()
+
+        rows = [
+            (
+                host_map.get(port['host_id'], 'UNKNOWN'),
+                port['port'],
+                port['protocol'],
+                port['state'],
+                port['service'] or '',
+                port['version'] or ''
+            )
+            for port in ports
+        ]
+
+        # Clear and refill as one screen update
+        with self.batch_update():
+            self.ports_table.clear()
+            self.ports_table.add_rows(rows)
+
     @on(Button.Pressed, "#btn-resolve")
     async def action_dns_resolve(self):
         """DNS resolution operation"""
-        target_input = self.query_one("#target-input", Input)
+        target_input = self.target_input
         target = target_input.value.strip()
 
         if not target:
@@ -636,7 +654,7 @@ class IPv9MilitaryTUI(App):
         self.mission_number += 1
 
         try:
-            addresses = self.resolver.resolve(target)
+            addresses = await self._cached_resolve(target)
 
             if addresses:
                 self.log_widget.write_log(f"DNS RESOLUTION: SUCCESS", "SUCCESS")
@@ -646,8 +664,8 @@ class IPv9MilitaryTUI(App):
                 # Store in database
                 if self.db:
                     for addr in addresses:
-                        await self.db.store_host(addr, target, alive=True)
-                    await self.refresh_stats()
+                        await self.db.store_host(_host_record(addr, target))
+                    self._db_dirty = True
             else:
                 self.log_widget.write_log(f"DNS RESOLUTION: NO RECORDS FOUND", "WARNING")
 
@@ -657,7 +675,7 @@ class IPv9MilitaryTUI(App):
     @on(Button.Pressed, "#btn-ping")
     async def action_ping(self):
         """Ping sweep operation"""
-        target_input = self.query_one("#target-input", Input)
+        target_input = self.target_input
         target = target_input.value.strip()
 
         if not target:
@@ -670,8 +688,8 @@ class IPv9MilitaryTUI(App):
 
         try:
             # First resolve if it's a domain
-            if not target.replace('.', '').isdigit():
-                addresses = self.resolver.resolve(target)
+            if not _IP_LITERAL_RE.fullmatch(target):
+                addresses = await self._cached_resolve(target)
                 if not addresses:
                     self.log_widget.write_log("PING: TARGET RESOLUTION FAILED", "ERROR")
                     return
@@ -680,13 +698,16 @@ class IPv9MilitaryTUI(App):
                 target_ip = target
 
             self.log_widget.write_log(f"PINGING: {target_ip}", "INFO")
-            result = self.discovery.ping_host(target_ip)
+            result = await asyncio.to_thread(self.discovery.ping, target_ip, _PING_COUNT)
 
-            if result:
+            if result.get('reachable'):
                 self.log_widget.write_log(f"PING: TARGET RESPONSIVE", "SUCCESS")
                 if self.db:
-                    await self.db.store_host(target_ip, target, alive=True)
-                    await self.refresh_stats()
+                    hostname = None if target == target_ip else target
+                    await self.db.store_host(_host_record(target_ip, hostname))
+                    self._db_dirty = True
+            elif 'error' in result:
+                self.log_widget.write_log(f"PING: OPERATION FAILED - {result['error']}", "ERROR")
             else:
                 self.log_widget.write_log(f"PING: NO RESPONSE", "WARNING")
 
@@ -696,8 +717,11 @@ class IPv9MilitaryTUI(App):
     @on(Button.Pressed, "#btn-scan")
     async def action_port_scan(self):
         """Port scanning operation"""
-        target_input = self.query_one("#target-input", Input)
-        ports_input = self.query_one("#ports-input", Input)
+        if self._job_running():
+            return
+
+        target_input = self.target_input
+        ports_input = self.ports_input
 
         target = target_input.value.strip()
         ports = ports_input.value.strip() or "80,443"
@@ -709,12 +733,14 @@ class IPv9MilitaryTUI(App):
         self.log_widget.write_log(f"MISSION {self.mission_number}: PORT SCAN OPERATION", "OPERATIONAL")
         self.log_widget.write_log(f"TARGET: {target} | PORTS: {ports}", "INFO")
         self.mission_number += 1
-        self.scanning = True
+        self._start_job(self._run_port_scan(target, ports))
 
+    async def _run_port_scan(self, target: str, ports: str) -> None:
+        """Resolve and port-scan target, storing open ports"""
         try:
             # Resolve target
-            if not target.replace('.', '').isdigit():
-                addresses = self.resolver.resolve(target)
+            if not _IP_LITERAL_RE.fullmatch(target):
+                addresses = await self._cached_resolve(target)
                 if not addresses:
                     self.log_widget.write_log("PORT SCAN: TARGET RESOLUTION FAILED", "ERROR")
                     return
@@ -723,7 +749,7 @@ class IPv9MilitaryTUI(App):
                 target_ip = target
 
             self.log_widget.write_log(f"INITIATING SCAN: {target_ip}", "INFO")
-            result = self.scanner.scan_nmap([target_ip], ports=ports)
+            result = await self.scanner.scan_nmap_async(target_ip, ports=ports)
 
             if result and 'hosts' in result:
                 for host in result['hosts']:
@@ -733,6 +759,7 @@ class IPv9MilitaryTUI(App):
                             "SUCCESS"
                         )
 
+                        rows = []
                         for port in host['ports']:
                             self.log_widget.write_log(
                                 f"  ► PORT {port['port']}/{port['protocol']}: "
@@ -740,32 +767,40 @@ class IPv9MilitaryTUI(App):
                                 "INFO"
                             )
 
-                            # Store in database
-                            if self.db:
-                                await self.db.store_port(
-                                    target_ip,
-                                    port['port'],
-                                    port['protocol'],
-                                    port['state'],
-                                    port.get('service'),
-                                    port.get('version')
-                                )
-
-                        await self.refresh_stats()
+                            service = port.get('service') or {}
+                            rows.append((
+                                target_ip,
+                                port['port'],
+                                port['protocol'],
+                                port['state'],
+                                service.get('name'),
+                                service.get('version')
+                            ))
+
+                        # Store in database, one transaction per host
+                        if self.db:
+                            await self.db.store_ports_bulk(rows)
+
+                        self._db_dirty = True
                     else:
                         self.log_widget.write_log("PORT SCAN: NO OPEN PORTS", "WARNING")
             else:
                 self.log_widget.write_log("PORT SCAN: NO RESULTS", "WARNING")
 
+        except asyncio.CancelledError:
+            self.log_widget.write_log("PORT SCAN: ABORTED", "WARNING")
         except Exception as e:
             self.log_widget.write_log(f"PORT SCAN: OPERATION FAILED - {str(e)}", "ERROR")
         finally:
-            self.scanning = False
+            self._finish_job()
 
     @on(Button.Pressed, "#btn-enum")
     async def action_enumerate(self):
         """Domain enumeration operation"""
-        target_input = self.query_one("#target-input", Input)
+        if self._job_running():
+            return
+
+        target_input = self.target_input
         pattern = target_input.value.strip()
 
         if not pattern:
@@ -775,47 +810,80 @@ class IPv9MilitaryTUI(App):
         self.log_widget.write_log(f"MISSION {self.mission_number}: DOMAIN ENUMERATION", "OPERATIONAL")
         self.log_widget.write_log(f"PATTERN: {pattern}", "INFO")
         self.mission_number += 1
-        self.scanning = True
+        self._start_job(self._run_enumerate(pattern))
+
+    async def _run_enumerate(self, pattern: str) -> None:
+        """Brute-force pattern, streaming discovered domains into the log"""
+        rows = []
 
         try:
             self.log_widget.write_log("ENUMERATION: COMMENCING...", "INFO")
 
-            results = self.enumerator.enumerate_pattern(pattern, max_results=100)
+            def on_progress(tried: int, total: int) -> None:
+                self.progress_bar.update(progress=100.0 * tried / total)
+
+            # Stream hits as each chunk resolves instead of waiting for the
+            # whole pattern
+            async for result in self.enumerator.brute_force_pattern_async(
+                pattern, "chn", 1000, progress_callback=on_progress
+            ):
+                domain = result['hostname']
+                addresses = result['addresses']
+                self.log_widget.write_log(f"  ► {domain} → {', '.join(addresses)}", "INFO")
+                rows.append((domain, addresses, True))
 
-            if results:
+            if rows:
                 self.log_widget.write_log(
-                    f"ENUMERATION: {len(results)} DOMAINS DISCOVERED",
+                    f"ENUMERATION: {len(rows)} DOMAINS DISCOVERED",
                     "SUCCESS"
                 )
 
-                for domain, addresses in results:
-                    self.log_widget.write_log(f"  ► {domain} → {', '.join(addresses)}", "INFO")
-
-                    # Store in database
-                    if self.db:
-                        await self.db.store_domain(domain, addresses, responsive=True)
+                # Store in database in a single transaction
+                if self.db:
+                    await self.db.store_domains_bulk(rows)
 
-                await self.refresh_stats()
+                self._db_dirty = True
             else:
                 self.log_widget.write_log("ENUMERATION: NO DOMAINS FOUND", "WARNING")
 
+        except asyncio.CancelledError:
+            self.log_widget.write_log(
+                f"ENUMERATION: ABORTED - {len(rows)} DOMAINS DISCOVERED",
+                "WARNING"
+            )
+
+            # Keep the hits already shown to the operator
+            if rows:
+                if self.db:
+                    await self.db.store_domains_bulk(rows)
+                self._db_dirty = True
+            self.progress_bar.update(progress=0)
         except Exception as e:
             self.log_widget.write_log(f"ENUMERATION: OPERATION FAILED - {str(e)}", "ERROR")
         finally:
-            self.scanning = False
+            self._finish_job()
 
     @on(Button.Pressed, "#btn-audit")
     async def action_full_audit(self):
         """Full tactical audit operation"""
+        if self._job_running():
+            return
+
         self.log_widget.write_log(f"MISSION {self.mission_number}: FULL TACTICAL AUDIT", "OPERATIONAL")
         self.log_widget.write_log("CLASSIFICATION: OPERATION NETWORK SWEEP", "INFO")
         self.mission_number += 1
-        self.scanning = True
+        self._start_job(self._run_full_audit())
 
+    async def _run_full_audit(self) -> None:
+        """Run the six-phase audit, reporting phases as they complete"""
         try:
-            def progress_callback(phase: str, progress: float):
-                self.progress_bar.update(progress=progress)
-                self.log_widget.write_log(f"AUDIT PHASE: {phase} ({progress:.1f}%)", "INFO")
+            def progress_callback(progress: float):
+                # Widgets may only be touched from the UI thread; hop over
+                # if the engine ever reports from a worker thread
+                if threading.get_ident() == self._ui_thread:
+                    self._apply_progress(progress)
+                else:
+                    self.call_from_thread(self._apply_progress, progress)
 
             self.log_widget.write_log("COMMENCING 6-PHASE TACTICAL AUDIT...", "INFO")
 
@@ -831,21 +899,25 @@ class IPv9MilitaryTUI(App):
             self.log_widget.write_log(f"HOSTS: {len(results.get('hosts', []))}", "INFO")
             self.log_widget.write_log(f"PORTS: {len(results.get('ports', []))}", "INFO")
 
-            await self.refresh_stats()
+            self._db_dirty = True
             self.progress_bar.update(progress=0)
 
+        except asyncio.CancelledError:
+            self.log_widget.write_log("AUDIT: ABORTED", "WARNING")
         except Exception as e:
             self.log_widget.write_log(f"AUDIT: OPERATION FAILED - {str(e)}", "ERROR")
         finally:
-            self.scanning = False
+            self._finish_job()
 
     @on(Button.Pressed, "#btn-masscan")
     async def action_masscan(self):
         """Masscan high-speed enumeration"""
+        if self._job_running():
+            return
+
         self.log_widget.write_log(f"MISSION {self.mission_number}: HIGH-SPEED NETWORK ENUMERATION", "OPERATIONAL")
         self.log_widget.write_log("TACTICAL ASSET: MASSCAN", "INFO")
         self.mission_number += 1
-        self.scanning = True
 
         try:
             # Create enumeration plan
@@ -861,20 +933,41 @@ class IPv9MilitaryTUI(App):
 
             self.log_widget.write_log("INITIATING HIGH-SPEED SCAN (10% SAMPLE)...", "INFO")
 
-            results = self.masscan_enum.enumerate_ipv9_space(
+            self._start_job(self._run_masscan())
+
+        except Exception as e:
+            self.log_widget.write_log(f"MASSCAN: OPERATION FAILED - {str(e)}", "ERROR")
+
+    async def _run_masscan(self) -> None:
+        """Stream masscan results into the tactical log"""
+        hosts = set()
+
+        try:
+            async for entry in self.masscan_enum.enumerate_ipv9_space_async(
                 sample_rate=0.10,
                 ports="80,443"
-            )
+            ):
+                hosts.add(entry['ip'])
+                for port in entry['ports']:
+                    self.log_widget.write_log(
+                        f"  ► {entry['ip']}:{port['port']}/{port['proto']} {port['status']}",
+                        "INFO"
+                    )
 
             self.log_widget.write_log(
-                f"MASSCAN: COMPLETE - {results.get('total_hosts', 0)} HOSTS IDENTIFIED",
+                f"MASSCAN: COMPLETE - {len(hosts)} HOSTS IDENTIFIED",
                 "SUCCESS"
             )
 
+        except asyncio.CancelledError:
+            self.log_widget.write_log(
+                f"MASSCAN: ABORTED - {len(hosts)} HOSTS IDENTIFIED",
+                "WARNING"
+            )
         except Exception as e:
             self.log_widget.write_log(f"MASSCAN: OPERATION FAILED - {str(e)}", "ERROR")
         finally:
-            self.scanning = False
+            self._finish_job()
 
     @on(Button.Pressed, "#btn-monitor")
     async def action_monitor(self):
@@ -889,6 +982,8 @@ class IPv9MilitaryTUI(App):
         """Emergency stop operation"""
         if self.scanning:
             self.log_widget.write_log("EMERGENCY STOP: ABORTING CURRENT OPERATION", "WARNING")
+            if self.current_job and not self.current_job.done():
+                self.current_job.cancel()
             self.scanning = False
             self.progress_bar.update(progress=0)
         else:
@@ -897,7 +992,7 @@ class IPv9MilitaryTUI(App):
     def action_show_stats(self) -> None:
         """Show tactical statistics"""
         self.log_widget.write_log("TACTICAL STATISTICS REFRESHED", "INFO")
-        asyncio.create_task(self.refresh_stats())
+        self._schedule_stats_refresh()
 
     def action_clear_logs(self) -> None:
         """Clear tactical log"""
@@ -920,11 +1015,23 @@ class IPv9MilitaryTUI(App):
     def action_refresh(self) -> None:
         """Refresh display"""
         self.log_widget.write_log("DISPLAY REFRESH COMPLETE", "INFO")
-        asyncio.create_task(self.refresh_stats())
+        self._schedule_stats_refresh()
+
+
+def _install_uvloop() -> None:
+    """Use uvloop's libuv event loop when available (pulled in by uvicorn[standard])"""
+    try:
+        import uvloop
+    except ImportError:
+        # Not installed (e.g. Windows) - stay on the stock asyncio loop
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 def main():
     """Main entry point for TEMPEST-compliant TUI"""
+    _install_uvloop()
     app = IPv9MilitaryTUI()
     app.run()
 
@@ -6,43 +6,256 @@ Optional web interface for monitoring and managing IPv9 scans.
 
 import os
 import json
+import atexit
+import functools
+import hashlib
 import logging
-from flask import Flask, render_template, jsonify, request
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Optional
+
+import orjson
+from flask import Flask, Response, render_template, jsonify, request, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 
+try:
+    from flask_compress import Compress
+except ImportError:  # optional; results are then sent uncompressed
+    Compress = None
+
 from ..dns import IPv9Resolver, DNSCache
 from ..scanner import PortScanner, HostDiscovery, DNSEnumerator
+from ..scanner.port_scanner import normalize_port_spec
 from ..config import ConfigManager
+from ..api.jobs import JobManager
 
 logger = logging.getLogger(__name__)
 
 
-def create_app(config_path=None):
+class _ErrorSampler(logging.Filter):
     """
-    Create and configure Flask application
+    Rate-limit repeated log records per message template
+
+    Lets through at most burst records with the same format string per
+    interval seconds; the first record of the next window carries the
+    number that were dropped. Keeps a flood of failing requests from
+    turning into a flood of log writes.
+    """
+
+    def __init__(self, burst: int = 10, interval: float = 60.0):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self._lock = threading.Lock()
+        # msg template -> [window start, passed, suppressed]
+        self._windows = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.ERROR:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(record.msg)
+            if window is None or now - window[0] >= self.interval:
+                suppressed = window[2] if window else 0
+                self._windows[record.msg] = [now, 1, 0]
+            elif window[1] < self.burst:
+                window[1] += 1
+                suppressed = 0
+            else:
+                window[2] += 1
+                return False
+
+        if suppressed:
+            record.msg = f"{record.msg} (%d similar suppressed)"
+            record.args = (record.args or ()) + (suppressed,)
+        return True
+
+
+logger.addFilter(_ErrorSampler())
+
+# Match the stdlib encoder on dicts keyed by ints (e.g. port numbers)
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_default(obj):
+    """Encode the few types orjson does not handle natively"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for jsonify and request.json"""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=_orjson_default, option=_ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class _WorkLimiter:
+    """
+    Bounded concurrency for one kind of expensive request
+
+    Requests beyond the limit are rejected with 429 instead of queueing
+    more nmap processes or DNS fan-outs; Retry-After follows a moving
+    average of how long the work takes.
+    """
+
+    def __init__(self, limit: int, initial_estimate: float = 30.0):
+        self._slots = threading.BoundedSemaphore(limit)
+        self.avg_duration = initial_estimate
+
+    def try_acquire(self) -> Optional[float]:
+        """Take a slot without blocking; returns the start time, or None if full"""
+        if not self._slots.acquire(blocking=False):
+            return None
+        return time.monotonic()
+
+    def release(self, started: float):
+        """Free the slot taken at started and fold its duration into the average"""
+        elapsed = time.monotonic() - started
+        self.avg_duration += 0.2 * (elapsed - self.avg_duration)
+        self._slots.release()
+
+    def busy_response(self) -> Response:
+        response = jsonify({'error': 'busy'})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(max(1, math.ceil(self.avg_duration)))
+        return response
+
+
+def _etag_for(body: bytes) -> str:
+    """Strong ETag for a prebuilt response body"""
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def _static_response(body: bytes, etag: str, mimetype: str, max_age: int) -> Response:
+    """
+    Serve a prebuilt body with caching headers
+
+    Answers 304 Not Modified when the request's If-None-Match matches etag.
+    """
+    response = Response(body, mimetype=mimetype)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+
+def _compression_for(app: Flask):
+    """
+    Return a view decorator that br/gzip-compresses large JSON responses
+
+    Compression is opt-in per view and skips NDJSON streams, so streamed
+    lines still reach the client as they are produced. A no-op when
+    flask-compress is not installed.
+    """
+    if Compress is None:
+        return lambda view: view
+
+    app.config.update(
+        COMPRESS_REGISTER=False,
+        COMPRESS_MIMETYPES=['application/json'],
+        COMPRESS_ALGORITHM=['br', 'gzip'],
+        COMPRESS_LEVEL=4,
+        COMPRESS_BR_LEVEL=4,
+        COMPRESS_MIN_SIZE=1024,
+        COMPRESS_STREAMS=False,
+    )
+    return Compress(app).compressed()
+
+
+@functools.lru_cache(maxsize=4)
+def _components_for(config_path=None) -> SimpleNamespace:
+    """
+    Load configuration and build the scanning components once per config path
+
+    Repeated create_app() calls (reloader, test harnesses) share one set of
+    components instead of leaking resolvers, caches and HTTP pools.
 
     Args:
         config_path: Path to configuration file
 
     Returns:
-        Flask application instance
+        Namespace with config, resolver, cache, scanner, discovery, enumerator,
+        plus the background job executor and registry
     """
-    app = Flask(__name__)
-    CORS(app)
-
-    # Load configuration
     config_manager = ConfigManager(config_path)
     config = config_manager.get_config()
 
-    # Initialize components
-    resolver = IPv9Resolver(config)
+    # One cache, shared by the resolver (and so the enumerator) and the views
     cache = DNSCache(
         max_size=config['dns']['cache_size'],
         default_ttl=config['dns']['ttl']
     )
-    scanner = PortScanner(config)
+    resolver = IPv9Resolver(config, cache=cache)
     discovery = HostDiscovery(config)
-    enumerator = DNSEnumerator(resolver, config)
+
+    # http_probe reuses one pooled client for the life of the process
+    atexit.register(discovery.close)
+
+    # Background scans/enumerations, so long jobs don't hold a request worker
+    executor = ThreadPoolExecutor(
+        max_workers=config['scanner'].get('concurrent_scans', 4),
+        thread_name_prefix='ipv9-web-job'
+    )
+    atexit.register(executor.shutdown, wait=False, cancel_futures=True)
+
+    return SimpleNamespace(
+        executor=executor,
+        jobs=JobManager(),
+        config=config,
+        resolver=resolver,
+        cache=cache,
+        scanner=PortScanner(config),
+        discovery=discovery,
+        enumerator=DNSEnumerator(resolver, config)
+    )
+
+
+# Forked workers must not share the parent's sockets and connection pools
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_components_for.cache_clear)
+
+
+def create_app(config_path=None):
+    """
+    Create and configure Flask application
+
+    Args:
+        config_path: Path to configuration file
+
+    Returns:
+        Flask application instance
+    """
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    CORS(app)
+
+    # Scan and enumeration results are large, repetitive JSON
+    compressed = _compression_for(app)
+
+    components = _components_for(config_path)
+    config = components.config
+    resolver = components.resolver
+    cache = components.cache
+    scanner = components.scanner
+    discovery = components.discovery
+    enumerator = components.enumerator
+    executor = components.executor
+    jobs = components.jobs
 
     # Store in app context
     app.config['IPV9_RESOLVER'] = resolver
@@ -52,11 +265,102 @@ def create_app(config_path=None):
     app.config['IPV9_ENUMERATOR'] = enumerator
     app.config['IPV9_CONFIG'] = config
 
+    # Concurrent scans/enumerations across all modes (sync, stream, background)
+    max_parallel = config['scanner'].get('max_parallel', 4)
+    scan_limiter = _WorkLimiter(max_parallel)
+    enum_limiter = _WorkLimiter(max_parallel)
+
+    def submit_job(job_type, fn, *args, on_done=None, **kwargs):
+        """
+        Run fn on the background executor and track it in the job registry
+
+        on_done, if given, is called once the job has finished either way.
+
+        Returns:
+            Job ID to poll via /api/jobs/<job_id>
+        """
+        # Lazy sweep of finished jobs past retention
+        jobs.cleanup_old_jobs()
+
+        job_id = jobs.create_job(job_type)
+
+        def run():
+            jobs.update_job(job_id, status='running', started_at=datetime.utcnow())
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                logger.error("Job %s (%s) failed: %s", job_id, job_type, e)
+                jobs.update_job(job_id, status='failed', error=str(e),
+                                completed_at=datetime.utcnow())
+            else:
+                jobs.update_job(job_id, status='completed', progress=100.0, result=result,
+                                completed_at=datetime.utcnow())
+            finally:
+                if on_done:
+                    on_done()
+
+        executor.submit(run)
+        return job_id
+
+    # hostname -> Future of the lookup currently in flight for it
+    inflight = {}
+    inflight_lock = threading.Lock()
+
+    def resolve_shared(hostname):
+        """
+        Resolve hostname upstream, coalescing concurrent lookups ("single-flight")
+
+        The first caller queries DNS and caches a non-empty answer; callers
+        arriving while that query is in flight wait for its result instead
+        of issuing their own.
+        """
+        key = hostname.lower()
+
+        with inflight_lock:
+            future = inflight.get(key)
+            leader = future is None
+            if leader:
+                future = inflight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            addresses = resolver.resolve(hostname)
+            if addresses:
+                cache.set(hostname, addresses)
+            future.set_result(addresses)
+            return addresses
+        except BaseException as e:
+            # Waiters must never be left hanging on the future
+            future.set_exception(e)
+            raise
+        finally:
+            with inflight_lock:
+                del inflight[key]
+
+    def resolve_target(target):
+        """
+        Map an IPv9 domain to its first address via the shared DNS cache
+
+        Non-IPv9 targets are returned unchanged; None means resolution failed.
+        """
+        if not resolver.is_ipv9_domain(target):
+            return target
+
+        addresses = cache.get(target) or resolve_shared(target)
+        return addresses[0] if addresses else None
+
+    # The dashboard only depends on per-process config, so render it once
+    with app.app_context():
+        index_html = render_template('index.html', config=config).encode('utf-8')
+    index_etag = _etag_for(index_html)
+
     # Routes
     @app.route('/')
     def index():
         """Main dashboard page"""
-        return render_template('index.html', config=config)
+        return _static_response(index_html, index_etag, 'text/html', max_age=60)
 
     @app.route('/api/resolve', methods=['POST'])
     def api_resolve():
@@ -77,11 +381,8 @@ def create_app(config_path=None):
                     'from_cache': True
                 })
 
-            # Resolve
-            addresses = resolver.resolve(hostname)
-
-            if addresses:
-                cache.set(hostname, addresses)
+            # Resolve (concurrent requests for the same name share one query)
+            addresses = resolve_shared(hostname)
 
             return jsonify({
                 'hostname': hostname,
@@ -90,7 +391,7 @@ def create_app(config_path=None):
             })
 
         except Exception as e:
-            logger.error(f"Resolve error: {e}")
+            logger.error("Resolve error: %s", e)
             return jsonify({'error': str(e)}), 500
 
     @app.route('/api/ping', methods=['POST'])
@@ -105,21 +406,20 @@ def create_app(config_path=None):
 
         try:
             # Resolve if IPv9 domain
-            if resolver.is_ipv9_domain(target):
-                addresses = resolver.resolve(target)
-                if not addresses:
-                    return jsonify({'error': 'failed to resolve'}), 400
-                target = addresses[0]
+            target = resolve_target(target)
+            if target is None:
+                return jsonify({'error': 'failed to resolve'}), 400
 
             # Ping
             result = discovery.ping(target, count)
             return jsonify(result)
 
         except Exception as e:
-            logger.error(f"Ping error: {e}")
+            logger.error("Ping error: %s", e)
             return jsonify({'error': str(e)}), 500
 
     @app.route('/api/scan', methods=['POST'])
+    @compressed
     def api_scan():
         """Scan ports"""
         data = request.json
@@ -130,21 +430,49 @@ def create_app(config_path=None):
         if not target:
             return jsonify({'error': 'target required'}), 400
 
+        # Reject malformed port lists before spawning nmap
+        ports = normalize_port_spec(str(ports))
+        if ports is None:
+            return jsonify({'error': 'invalid ports'}), 400
+
+        started = scan_limiter.try_acquire()
+        if started is None:
+            return scan_limiter.busy_response()
+        release = functools.partial(scan_limiter.release, started)
+        handed_off = False
+
         try:
             # Resolve if IPv9 domain
-            if resolver.is_ipv9_domain(target):
-                addresses = resolver.resolve(target)
-                if not addresses:
-                    return jsonify({'error': 'failed to resolve'}), 400
-                target = addresses[0]
+            target = resolve_target(target)
+            if target is None:
+                return jsonify({'error': 'failed to resolve'}), 400
+
+            if data.get('background'):
+                job_id = submit_job('port_scan', scanner.scan_nmap, target, ports, scan_type,
+                                    service_detection=True, on_done=release)
+                handed_off = True
+                return jsonify({'job_id': job_id, 'status': 'pending'}), 202
+
+            if data.get('stream'):
+                # One host per line as nmap completes it; errors arrive as
+                # a final {"error": ...} line
+                hosts = scanner.scan_nmap_stream(target, ports, scan_type, service_detection=True)
+                lines = (orjson.dumps(host, option=_ORJSON_OPTIONS) + b'\n' for host in hosts)
+                response = Response(stream_with_context(lines), mimetype='application/x-ndjson')
+                response.call_on_close(release)
+                handed_off = True
+                return response
 
             # Scan
             result = scanner.scan_nmap(target, ports, scan_type, service_detection=True)
             return jsonify(result)
 
         except Exception as e:
-            logger.error(f"Scan error: {e}")
+            logger.error("Scan error: %s", e)
             return jsonify({'error': str(e)}), 500
+        finally:
+            if not handed_off:
+                release()
 
     @app.route('/api/http-probe', methods=['POST'])
     def api_http_probe():
@@ -159,21 +487,20 @@ def create_app(config_path=None):
 
         try:
             # Resolve if IPv9 domain
-            if resolver.is_ipv9_domain(target):
-                addresses = resolver.resolve(target)
-                if not addresses:
-                    return jsonify({'error': 'failed to resolve'}), 400
-                target = addresses[0]
+            target = resolve_target(target)
+            if target is None:
+                return jsonify({'error': 'failed to resolve'}), 400
 
             # Probe
             result = discovery.http_probe(target, port, use_https)
             return jsonify(result)
 
         except Exception as e:
-            logger.error(f"HTTP probe error: {e}")
+            logger.error("HTTP probe error: %s", e)
             return jsonify({'error': str(e)}), 500
 
     @app.route('/api/enumerate', methods=['POST'])
+    @compressed
     def api_enumerate():
         """Enumerate domains"""
         data = request.json
@@ -184,13 +511,53 @@ def create_app(config_path=None):
         if not pattern:
             return jsonify({'error': 'pattern required'}), 400
 
+        started = enum_limiter.try_acquire()
+        if started is None:
+            return enum_limiter.busy_response()
+        release = functools.partial(enum_limiter.release, started)
+        handed_off = False
+
         try:
+            if data.get('background'):
+                job_id = submit_job('enumeration', lambda: {
+                    'results': enumerator.brute_force_pattern(pattern, tld, max_combinations)
+                }, on_done=release)
+                handed_off = True
+                return jsonify({'job_id': job_id, 'status': 'pending'}), 202
+
+            if data.get('stream'):
+                def stream_hits():
+                    # One JSON object per line, flushed as each hit resolves;
+                    # a failure mid-stream is reported as a final error line
+                    try:
+                        for hit in enumerator.iter_brute_force_pattern(pattern, tld, max_combinations):
+                            yield orjson.dumps(hit) + b'\n'
+                    except Exception as e:
+                        logger.error("Enumerate error: %s", e)
+                        yield orjson.dumps({'error': str(e)}) + b'\n'
+
+                response = Response(stream_with_context(stream_hits()), mimetype='application/x-ndjson')
+                response.call_on_close(release)
+                handed_off = True
+                return response
+
             results = enumerator.brute_force_pattern(pattern, tld, max_combinations)
             return jsonify({'results': results})
 
         except Exception as e:
-            logger.error(f"Enumerate error: {e}")
+            logger.error("Enumerate error: %s", e)
             return jsonify({'error': str(e)}), 500
+        finally:
+            if not handed_off:
+                release()
+
+    @app.route('/api/jobs/<job_id>', methods=['GET'])
+    def api_job(job_id):
+        """Get background job status (and result once completed)"""
+        job = jobs.get_job(job_id)
+        if job is None:
+            return jsonify({'error': 'job not found'}), 404
+        return jsonify(job)
 
     @app.route('/api/cache/stats', methods=['GET'])
     def api_cache_stats():
@@ -200,7 +567,7 @@ def create_app(config_path=None):
             return jsonify(stats)
 
         except Exception as e:
-            logger.error(f"Cache stats error: {e}")
+            logger.error("Cache stats error: %s", e)
             return jsonify({'error': str(e)}), 500
 
     @app.route('/api/cache/clear', methods=['POST'])
@@ -211,61 +578,108 @@ def create_app(config_path=None):
             return jsonify({'status': 'cache cleared'})
 
         except Exception as e:
-            logger.error(f"Cache clear error: {e}")
+            logger.error("Cache clear error: %s", e)
             return jsonify({'error': str(e)}), 500
 
+    # Config and health payloads are fixed for the life of the process;
+    # encode them once so polls cost a 304 or a buffer write.
+    # Sanitized config: no sensitive data
+    sanitized_config = {
+        'dns': {
+            'primary': config['dns']['primary'],
+            'secondary': config['dns']['secondary'],
+            'cache_size': config['dns']['cache_size']
+        },
+        'scanner': config['scanner'],
+        'security': {
+            'verify_dns': config['security']['verify_dns'],
+            'log_level': config['security']['log_level']
+        }
+    }
+    config_body = app.json.dumps(sanitized_config).encode('utf-8')
+    config_etag = _etag_for(config_body)
+
+    health_body = app.json.dumps({
+        'status': 'healthy',
+        'version': '1.0.0'
+    }).encode('utf-8')
+    health_etag = _etag_for(health_body)
+
     @app.route('/api/config', methods=['GET'])
     def api_config():
         """Get configuration (sanitized)"""
-        try:
-            # Return sanitized config (no sensitive data)
-            sanitized = {
-                'dns': {
-                    'primary': config['dns']['primary'],
-                    'secondary': config['dns']['secondary'],
-                    'cache_size': config['dns']['cache_size']
-                },
-                'scanner': config['scanner'],
-                'security': {
-                    'verify_dns': config['security']['verify_dns'],
-                    'log_level': config['security']['log_level']
-                }
-            }
-            return jsonify(sanitized)
-
-        except Exception as e:
-            logger.error(f"Config error: {e}")
-            return jsonify({'error': str(e)}), 500
+        return _static_response(config_body, config_etag, 'application/json', max_age=5)
 
     @app.route('/health', methods=['GET'])
     def health():
         """Health check endpoint"""
-        return jsonify({
-            'status': 'healthy',
-            'version': '1.0.0'
-        })
+        return _static_response(health_body, health_etag, 'application/json', max_age=5)
 
     return app
 
 
+def _run_gunicorn(args) -> bool:
+    """
+    Serve the dashboard with gunicorn's threaded workers, if installed
+
+    Each worker builds its own app after forking, so sockets and HTTP pools
+    are never shared between processes.
+
+    Returns:
+        False if gunicorn is not available
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        return False
+
+    class DashboardApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f"{args.host}:{args.port}")
+            self.cfg.set('workers', args.workers)
+            self.cfg.set('worker_class', 'gthread')
+            self.cfg.set('threads', args.threads)
+            # Synchronous scans can legitimately run for minutes
+            self.cfg.set('timeout', 300)
+
+        def load(self):
+            return create_app(args.config)
+
+    DashboardApplication().run()
+    return True
+
+
 def main():
-    """Run development server"""
+    """Run web dashboard server"""
     import argparse
 
     parser = argparse.ArgumentParser(description='IPv9 Web Dashboard')
     parser.add_argument('--config', '-c', help='Configuration file')
     parser.add_argument('--host', default='127.0.0.1', help='Host to bind to')
     parser.add_argument('--port', '-p', type=int, default=8080, help='Port to bind to')
-    parser.add_argument('--debug', action='store_true', help='Enable debug mode')
+    parser.add_argument('--debug', action='store_true', help='Enable debug mode (implies --dev)')
+    parser.add_argument('--dev', action='store_true', help='Use the Flask development server')
+    # Background jobs live in the worker that accepted them, so scale with
+    # threads by default; more workers need sticky routing for /api/jobs
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                        help='gunicorn worker processes (default: 1)')
+    parser.add_argument('--threads', type=int, default=16,
+                        help='Request threads per gunicorn worker (default: 16)')
 
     args = parser.parse_args()
 
+    print(f"Starting IPv9 Web Dashboard on http://{args.host}:{args.port}")
+
+    if not (args.dev or args.debug):
+        if _run_gunicorn(args):
+            return
+        logger.warning("gunicorn not installed - falling back to the Flask development server")
+
     # Create app
     app = create_app(args.config)
 
     # Run server
-    print(f"Starting IPv9 Web Dashboard on http://{args.host}:{args.port}")
-    app.run(host=args.host, port=args.port, debug=args.debug)
+    app.run(host=args.host, port=args.port, debug=args.debug, threaded=True)
 
 
 if __name__ == '__main__':
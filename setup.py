@@ -29,7 +29,15 @@ setup(
     license="MIT",
     packages=find_packages(),
     install_requires=requirements,
-    python_requires=">=3.7",
+    extras_require={
+        # Optional for the web dashboard; it falls back to Flask's server
+        # and uncompressed responses without them
+        'web': [
+            'gunicorn>=21.2.0',
+            'flask-compress>=1.10.0',
+        ],
+    },
+    python_requires=">=3.9",
     entry_points={
         'console_scripts': [
             'ipv9tool=ipv9tool.cli.commands:main',
@@ -44,8 +52,6 @@ setup(
         "Intended Audience :: Science/Research",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",